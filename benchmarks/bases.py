@@ -0,0 +1,71 @@
+"""
+Системы счисления: прежний цикл divmod против data_types.bases.
+
+Запуск из корня проекта:
+    python -m benchmarks.bases
+"""
+import random
+import time
+
+from data_types import bases
+from data_types.int import WeakInt
+
+
+def old_digits(value: int, new_base: int) -> str:
+    """
+    Цикл прежнего to_base: divmod на каждую цифру. Итоговое
+    int(''.join(digits)) не выполняется - для записей длиннее
+    4300 цифр оно упирается в sys.get_int_max_str_digits().
+    """
+    digits = []
+    while value > 0:
+        value, remainder = divmod(value, new_base)
+        digits.append(bases.DIGITS[remainder])
+    digits.reverse()
+    return ''.join(digits)
+
+
+def old_parse(digits: str, base: int) -> int:
+    value = 0
+    for digit in digits:
+        value = value * base + bases.DIGITS.index(digit)
+    return value
+
+
+def elapsed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(sizes=(1000, 10000, 50000), base_list=(7, 62)):
+    random.seed(0)
+    for digits in sizes:
+        value = random.getrandbits(int(digits * 3.33))
+        print(f'\nЧисло из {digits} десятичных цифр:')
+        for base in base_list:
+            text = bases.to_base(value, base)
+            assert old_digits(value, base) == text
+            assert bases.from_base(text, base) == value
+            print(f'  основание {base:>2}: '
+                  f'в строку {elapsed(lambda: old_digits(value, base)):.3f}s'
+                  f' -> {elapsed(lambda: bases.to_base(value, base)):.3f}s,'
+                  f' из строки {elapsed(lambda: old_parse(text, base)):.3f}s'
+                  f' -> {elapsed(lambda: bases.from_base(text, base)):.3f}s')
+
+
+def run_batch(count: int = 100000, base: int = 7):
+    random.seed(0)
+    numbers = [WeakInt(random.getrandbits(64)) for _ in range(count)]
+    print(f'\n{count} чисел по 64 бита, основание {base}:')
+    for name, func in (
+            ('прежний to_base', lambda: [WeakInt(old_digits(n, base))
+                                         for n in numbers]),
+            ('to_base', lambda: [n.to_base(base) for n in numbers]),
+            ('to_base_many', lambda: WeakInt.to_base_many(numbers, base))):
+        print(f'{name:>16}: {elapsed(func):.3f}s')
+
+
+if __name__ == '__main__':
+    run()
+    run_batch()
@@ -0,0 +1,59 @@
+"""
+Пропускная способность столбцовых функций data_types.columns
+против цикла с созданием WeakStr на каждую ячейку.
+
+Запуск из корня проекта:
+    python -m benchmarks.columns
+"""
+import random
+import time
+
+from data_types.columns import (extract_numbers_many, is_valid_email_many,
+                                mask_credit_card_many)
+from data_types.str import WeakStr
+
+
+def make_column(size: int):
+    random.seed(0)
+    cells = []
+    for i in range(size):
+        kind = i % 3
+        if kind == 0:
+            cells.append(f'user{i}@example.com')
+        elif kind == 1:
+            cells.append(''.join(random.choice('0123456789')
+                                 for _ in range(16)))
+        else:
+            cells.append(f'order {i} qty {random.randint(1, 99)}')
+    return cells
+
+
+def rate(func, column) -> float:
+    start = time.perf_counter()
+    func(column)
+    return len(column) / (time.perf_counter() - start)
+
+
+def run(size: int = 1000000, processes: int = 4):
+    column = make_column(size)
+    cases = (
+        ('is_valid_email',
+         lambda c: [WeakStr(v).is_valid_email() for v in c],
+         is_valid_email_many),
+        ('mask_credit_card',
+         lambda c: [WeakStr(v).mask_credit_card() for v in c],
+         mask_credit_card_many),
+        ('extract_numbers',
+         lambda c: [WeakStr(v).extract_numbers() for v in c],
+         extract_numbers_many),
+    )
+    print(f'{size} строк, строк/с:')
+    for name, loop, bulk in cases:
+        parallel = rate(lambda c: bulk(c, processes=processes), column)
+        print(f'{name:>17}: цикл {rate(loop, column):>12,.0f} '
+              f'столбец {rate(bulk, column):>12,.0f} '
+              f'{processes} процесса {parallel:>12,.0f}')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,57 @@
+"""
+SuperiorList и CompactList: память и агрегаты на числах.
+
+Запуск из корня проекта:
+    python -m benchmarks.compact
+"""
+import random
+import time
+import tracemalloc
+
+from data_types.compact import np
+from data_types.list import SuperiorList
+
+
+def elapsed(func, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def allocated(build) -> int:
+    tracemalloc.start()
+    try:
+        result = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def run(size: int = 1000000):
+    random.seed(0)
+    cases = (
+        ('float', lambda: [random.random() for _ in range(size)]),
+        ('int', lambda: [random.randrange(10 ** 9) for _ in range(size)]),
+    )
+    print('NumPy:', 'есть' if np is not None else 'нет (встроенные функции)')
+    for kind, make in cases:
+        print(f'\n{size} значений {kind}:')
+        plain = SuperiorList(make())
+        compact = plain.compact()
+        for name, container in (('SuperiorList', plain),
+                                ('CompactList', compact)):
+            memory = allocated(lambda: container.__class__(make()))
+            print(f'{name:>13}: {memory / size:>5.1f} байт/элемент', end='')
+            for method in ('sum', 'avg', 'max', 'min'):
+                spent = elapsed(getattr(container, method))
+                print(f'  {method} {spent * 1000:>7.2f}ms', end='')
+            print()
+
+
+if __name__ == '__main__':
+    run()
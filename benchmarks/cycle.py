@@ -0,0 +1,54 @@
+"""
+cycle(): прежний генератор с индексацией против CycleIterator.
+
+Запуск из корня проекта:
+    python -m benchmarks.cycle
+"""
+import time
+from itertools import islice
+
+from data_types.list import SuperiorList
+from data_types.tuple import ModifiableTuple
+
+
+def old_cycle(data):
+    """
+    Прежний cycle(): индексация и len() на каждом шаге.
+    """
+    number_iter = 0
+    while True:
+        yield data[number_iter]
+        number_iter += 1
+        if number_iter >= len(data):
+            number_iter = 0
+
+
+def elapsed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def consume(iterator, count: int) -> None:
+    for _ in islice(iterator, count):
+        pass
+
+
+def run(count: int = 2000000, size: int = 1000):
+    print(f'{count} шагов по коллекции из {size} элементов:')
+    for data in (SuperiorList(range(size)), ModifiableTuple(range(size))):
+        cases = (
+            ('прежний генератор', lambda: consume(old_cycle(data), count)),
+            ('for по cycle()', lambda: consume(data.cycle(), count)),
+            ('take(n)', lambda: data.cycle().take(count)),
+            ('batches(1000)', lambda: consume(data.cycle().batches(1000),
+                                              count // 1000)),
+            ('round robin x2', lambda: consume(data.cycle(data), count)),
+        )
+        print(type(data).__name__)
+        for name, func in cases:
+            print(f'{name:>20}: {elapsed(func):>7.3f}s')
+
+
+if __name__ == '__main__':
+    run()
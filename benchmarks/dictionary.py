@@ -0,0 +1,146 @@
+"""
+Позиционный доступ к IndexDict против прежнего копирования items().
+
+Запуск из корня проекта:
+    python -m benchmarks.dictionary
+"""
+import random
+import time
+
+from data_types.dictionary import IndexDict
+
+
+def old_get(data: dict, index: int):
+    element = list(dict.items(data))[index]
+    return {element[0]: element[1]}
+
+
+def old_set(data: dict, index: int, value) -> None:
+    elements = list(map(lambda i: [i[0], i[1]], dict.items(data)))
+    dict.__setitem__(data, elements[index][0], value)
+
+
+def old_remove(data: dict, index: int) -> None:
+    elements = list(map(lambda i: [i[0], i[1]], dict.items(data)))
+    dict.pop(data, elements[index][0])
+
+
+def per_operation(func, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def run(size: int = 1000000, old_count: int = 10, new_count: int = 100000):
+    random.seed(0)
+    data = IndexDict((f'key{i}', i) for i in range(size))
+    plain = dict(data)
+    cases = (
+        ('get',
+         lambda: old_get(plain, random.randrange(size)),
+         lambda: data[random.randrange(size)]),
+        ('set',
+         lambda: old_set(plain, random.randrange(size), 0),
+         lambda: data.__setitem__(random.randrange(size), 0)),
+        ('remove',
+         lambda: old_remove(plain, random.randrange(len(plain))),
+         lambda: data.remove_by_index(random.randrange(len(data)))),
+    )
+    print(f'{size} элементов, мкс на операцию:')
+    for name, old, new in cases:
+        print(f'{name:>8}: прежний {per_operation(old, old_count):>12.1f} '
+              f'новый {per_operation(new, new_count):>8.2f}')
+
+
+def run_values(size: int = 1000000, distinct: int = 1000):
+    print(f'\nПоиск и удаление по значению, {size} элементов:')
+    for indexed in (False, True):
+        data = IndexDict((f'key{i}', i % distinct) for i in range(size))
+        if indexed:
+            data.enable_value_index()
+        lookup = per_operation(lambda: data.keys_for_value(7), 10)
+        start = time.perf_counter()
+        data.remove_all_by_value(7)
+        removal = (time.perf_counter() - start) * 1e6
+        print(f'{"с индексом" if indexed else "без индекса":>12}: '
+              f'keys_for_value {lookup:>10.1f} мкс, '
+              f'remove_all_by_value {removal:>10.1f} мкс, '
+              f'индекс {data.value_index_size() / 2 ** 20:.1f} MiB')
+
+
+def build_tree(width: int, depth: int) -> dict:
+    root = {}
+    level = [root]
+    for _ in range(depth - 1):
+        next_level = []
+        for node in level:
+            for i in range(width):
+                child = node[f'n{i}'] = {}
+                next_level.append(child)
+        level = next_level
+    for node in level:
+        for i in range(width):
+            node[f'v{i}'] = i
+    return root
+
+
+def run_traversal(width: int = 10, depth: int = 6, chain: int = 100000):
+    data = IndexDict(build_tree(width, depth))
+    nodes = sum(width ** level for level in range(1, depth + 1))
+    print(f'\nОбход документа из {nodes} узлов:')
+    cases = (
+        ('check_depth', data.check_depth),
+        ('flatten', data.flatten),
+        ('apply_rule_depth', lambda: data.apply_rule_depth(abs)),
+    )
+    for name, func in cases:
+        print(f'{name:>17}: {per_operation(func, 1) / 1e6:.3f}s')
+
+    deep = node = {}
+    for _ in range(chain):
+        node = node.setdefault('k', {})
+    deep = IndexDict(deep)
+    print(f'Цепочка глубиной {chain}: check_depth '
+          f'{per_operation(deep.check_depth, 1) / 1e6:.3f}s')
+
+
+def old_sort(data: IndexDict) -> IndexDict:
+    """
+    Прежний IndexDict.sort: три полные копии данных.
+    """
+    sorted_data = sorted(tuple(dict.items(data)), key=lambda x: x[1])
+    data.clear()
+    for key, value in sorted_data:
+        data[key] = value
+    return IndexDict(sorted_data)
+
+
+def run_sorted(size: int = 200000, batches: int = 50, batch: int = 100):
+    random.seed(0)
+    print(f'\n{batches} пачек по {batch} вставок в словарь из {size}:')
+    base = [(f'key{i}', random.random()) for i in range(size)]
+    updates = [[(f'new{b}_{i}', random.random()) for i in range(batch)]
+               for b in range(batches)]
+
+    def resort():
+        data = IndexDict(base)
+        for chunk in updates:
+            data.update(chunk)
+            old_sort(data)
+
+    def kept():
+        data = IndexDict(base).keep_index_sorted()
+        for chunk in updates:
+            data.update(chunk)
+
+    for name, func in (('sort после пачки', resort),
+                       ('keep_index_sorted', kept)):
+        print(f'{name:>17}: {per_operation(func, 1) / 1e6:.3f}s')
+
+
+if __name__ == '__main__':
+    run()
+    run_values()
+    run_traversal()
+    run_sorted()
@@ -0,0 +1,114 @@
+"""
+Сравнение движка расстояния Левенштейна с прежней рекурсивной версией.
+
+Запуск из корня проекта:
+    python -m benchmarks.distance
+"""
+import random
+import string
+import timeit
+
+from data_types.distance import (FuzzyIndex, get_close_matches_many,
+                                 levenshtein)
+from data_types.str import WeakStr
+
+
+def recursive_distance(a: str, b: str) -> int:
+    """
+    Прежняя реализация WeakStr._calculate_distance.
+    """
+    if not a:
+        return len(b)
+    if not b:
+        return len(a)
+    if a[0] == b[0]:
+        return recursive_distance(a[1:], b[1:])
+    l1 = recursive_distance(a, b[1:])
+    l2 = recursive_distance(a[1:], b)
+    l3 = recursive_distance(a[1:], b[1:])
+    return min(l1, l2, l3) + 1
+
+
+def random_word(length: int) -> str:
+    return ''.join(random.choice(string.ascii_lowercase)
+                   for _ in range(length))
+
+
+def run(lengths=(4, 6, 8, 10), number: int = 3):
+    random.seed(0)
+    print(f'{"длина":>6} {"рекурсия":>12} {"полоса":>12} '
+          f'{"полоса k=2":>12} {"битовый":>12}')
+    for length in lengths:
+        a, b = random_word(length), random_word(length)
+        results = [
+            timeit.timeit(lambda: recursive_distance(a, b), number=number),
+            timeit.timeit(lambda: levenshtein(a, b), number=number),
+            timeit.timeit(lambda: levenshtein(a, b, 2), number=number),
+            timeit.timeit(lambda: levenshtein(a, b, bit_parallel=True),
+                          number=number),
+        ]
+        print(f'{length:>6} ' + ' '.join(
+            f'{t / number * 1000:>10.3f}ms' for t in results))
+
+    print('\nБез рекурсивной версии:')
+    for length in (20, 100, 1000):
+        a, b = random_word(length), random_word(length)
+        full = timeit.timeit(lambda: levenshtein(a, b), number=number)
+        banded = timeit.timeit(lambda: levenshtein(a, b, 5), number=number)
+        bits = timeit.timeit(lambda: levenshtein(a, b, bit_parallel=True),
+                             number=number)
+        print(f'{length:>6} {full / number * 1000:>10.3f}ms '
+              f'{banded / number * 1000:>10.3f}ms '
+              f'{bits / number * 1000:>10.3f}ms')
+
+
+def typo(word: str) -> str:
+    position = random.randrange(len(word))
+    return word[:position] + random.choice(string.ascii_lowercase) + \
+        word[position + 1:]
+
+
+def run_index(size: int = 50000, queries: int = 20, number: int = 1):
+    random.seed(0)
+    words = [random_word(random.randint(5, 12)) for _ in range(size)]
+    index = FuzzyIndex(words)
+    workloads = (
+        ('случайные', [WeakStr(random_word(8)) for _ in range(queries)]),
+        ('с опечаткой', [WeakStr(typo(random.choice(words)))
+                         for _ in range(queries)]),
+    )
+    print(f'\nИндекс на {size} слов, {queries} запросов:')
+    for cutoff in (0.25, 0.6):
+        for name, samples in workloads:
+            scan = timeit.timeit(
+                lambda: [q.get_close_matches(words, cutoff=cutoff)
+                         for q in samples],
+                number=number)
+            indexed = timeit.timeit(
+                lambda: [q.get_close_matches(index, cutoff=cutoff)
+                         for q in samples],
+                number=number)
+            print(f'cutoff={cutoff}, {name:>11}: '
+                  f'список {scan / number:.3f}s, '
+                  f'FuzzyIndex {indexed / number:.3f}s')
+
+
+def run_batch(size: int = 50000, queries: int = 1000,
+              processes=(1, 2, 4)):
+    random.seed(0)
+    words = [random_word(random.randint(5, 12)) for _ in range(size)]
+    index = FuzzyIndex(words)
+    samples = [random_word(8) for _ in range(queries)]
+    print(f'\nПакетный поиск, {queries} запросов:')
+    for count in processes:
+        elapsed = timeit.timeit(
+            lambda: get_close_matches_many(samples, index,
+                                           processes=count),
+            number=1)
+        print(f'{count:>3} процесс(ов): {elapsed:.3f}s')
+
+
+if __name__ == '__main__':
+    run()
+    run_index()
+    run_batch()
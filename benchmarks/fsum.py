@@ -0,0 +1,65 @@
+"""
+Сумма множества цен: цепочка CorrectFloat + против CorrectFloat.fsum.
+
+Точная сумма считается в Decimal по записям чисел.
+
+Запуск из корня проекта:
+    python -m benchmarks.fsum
+"""
+import random
+import time
+from decimal import Decimal
+
+from data_types.float import CorrectFloat, FloatAccumulator, np
+
+
+def elapsed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def chained(values):
+    total = CorrectFloat(0.0)
+    for value in values:
+        total = total + value
+    return total
+
+
+def accumulated(values):
+    total = FloatAccumulator()
+    for value in values:
+        total += value
+    return total.value()
+
+
+def run(size: int = 1000000):
+    random.seed(0)
+    datasets = (
+        ('цен с двумя знаками',
+         [round(random.uniform(0, 1000), 2) for _ in range(size)]),
+        ('чисел полной точности',
+         [random.uniform(0, 1000) for _ in range(size)]),
+    )
+    for title, values in datasets:
+        exact = sum(map(Decimal, map(repr, values)))
+        cases = [
+            ('sum()', lambda: sum(values)),
+            ('цепочка +', lambda: chained(values)),
+            ('FloatAccumulator +=', lambda: accumulated(values)),
+            ('fsum(список)', lambda: CorrectFloat.fsum(values)),
+            ('fsum(генератор)', lambda: CorrectFloat.fsum(iter(values))),
+        ]
+        if np is not None:
+            array = np.array(values)
+            cases.append(('fsum(массив NumPy)',
+                          lambda: CorrectFloat.fsum(array)))
+        print(f'\n{size} {title}, точная сумма {exact:.6f}:')
+        for name, func in cases:
+            result, spent = elapsed(func)
+            error = abs(Decimal(repr(result)) - exact)
+            print(f'{name:>20}: {spent:>7.3f}s, ошибка {error:.2e}')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,57 @@
+"""
+Хеширование: большие буферы и множество маленьких ключей.
+
+Запуск из корня проекта:
+    python -m benchmarks.hashing
+"""
+import hashlib
+import os
+import tempfile
+import time
+
+from data_types.hashing import hash_many, hash_stream
+from data_types.str import WeakStr
+
+
+def elapsed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run_large(size: int = 256 * 2 ** 20):
+    data = os.urandom(size)
+    with tempfile.NamedTemporaryFile(delete=False) as file:
+        file.write(data)
+    try:
+        mib = size / 2 ** 20
+        cases = (
+            ('hashlib целиком', lambda: hashlib.sha256(data).hexdigest()),
+            ('hash_stream буфер', lambda: hash_stream(data)),
+            ('hash_stream файл', lambda: hash_stream(file.name)),
+        )
+        print(f'Буфер {mib:.0f} MiB:')
+        for name, func in cases:
+            print(f'{name:>20}: {mib / elapsed(func):>8.1f} MiB/s')
+    finally:
+        os.remove(file.name)
+
+    text = 'x' * (64 * 2 ** 20)
+    print(f'{"WeakStr 64 MiB":>20}: '
+          f'{64 / elapsed(lambda: WeakStr(text).hash_string()):>8.1f} MiB/s')
+
+
+def run_small(count: int = 1000000, workers=(1, 2, 4)):
+    keys = [f'user:{i}' for i in range(count)]
+    loop = elapsed(lambda: [WeakStr(k).hash_string() for k in keys])
+    print(f'\n{count} ключей:')
+    print(f'{"цикл WeakStr":>20}: {count / loop:>12,.0f} ключей/с')
+    for number in workers:
+        spent = elapsed(lambda: hash_many(keys, workers=number))
+        print(f'{f"hash_many x{number}":>20}: '
+              f'{count / spent:>12,.0f} ключей/с')
+
+
+if __name__ == '__main__':
+    run_large()
+    run_small()
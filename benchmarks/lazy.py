@@ -0,0 +1,56 @@
+"""
+Цепочки вызовов: промежуточные коллекции против ленивого конвейера.
+
+Запуск из корня проекта:
+    python -m benchmarks.lazy
+"""
+import time
+import tracemalloc
+
+from data_types.list import SuperiorList
+from data_types.tuple import ModifiableTuple
+
+
+def measure(func):
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        result = func()
+        spent = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, spent, peak
+
+
+def run(size: int = 1000000):
+    values = [i if i % 4 else str(i) for i in range(size)]
+    data = SuperiorList(values)
+    frozen = ModifiableTuple(values)
+
+    def eager_list():
+        return data.get_by_type(int).filter(lambda x: x % 3) \
+            .apply_rule(lambda x: x * 2).sum()
+
+    def eager_tuple():
+        # filter у ModifiableTuple отбрасывает элементы, для которых
+        # функция истинна, а apply_rule сейчас не работает.
+        selected = frozen.get_by_type(int).filter(lambda x: not x % 3)
+        return ModifiableTuple([x * 2 for x in selected]).sum()
+
+    def lazy(source):
+        return lambda: source.lazy().select_type(int) \
+            .filter(lambda x: x % 3).map(lambda x: x * 2).sum()
+
+    print(f'{size} элементов, select_type -> filter -> map -> sum:')
+    for name, func in (('SuperiorList', eager_list),
+                       ('SuperiorList.lazy', lazy(data)),
+                       ('ModifiableTuple', eager_tuple),
+                       ('ModifiableTuple.lazy', lazy(frozen))):
+        result, spent, peak = measure(func)
+        print(f'{name:>20}: {spent:>7.3f}s, пик памяти '
+              f'{peak / 2 ** 20:>7.1f} MiB (сумма {result})')
+
+
+if __name__ == '__main__':
+    run()
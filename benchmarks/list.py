@@ -0,0 +1,102 @@
+"""
+SuperiorList: удаление элементов поочерёдно и сжатием за один проход.
+
+Запуск из корня проекта:
+    python -m benchmarks.list
+"""
+import time
+
+from data_types.list import SuperiorList
+
+
+def elapsed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def old_remove_all(data: list, other) -> list:
+    """
+    Прежний SuperiorList.remove_all: list.remove на каждое вхождение.
+    """
+    for i in range(data.count(other)):
+        data.remove(other)
+    return data
+
+
+def old_remove_where(data: list, predicate) -> list:
+    """
+    Корректный вариант прежних filter и remove_by_type: del по
+    индексу (с конца, чтобы не пропускать элементы).
+    """
+    for i in range(len(data) - 1, -1, -1):
+        if predicate(data[i]):
+            del data[i]
+    return data
+
+
+def run(sizes=(10000, 20000, 40000), large: int = 10000000):
+    def make(size):
+        return SuperiorList(i % 3 if i % 2 else 'x' for i in range(size))
+
+    print('Удаление половины элементов:')
+    for size in sizes:
+        old = elapsed(lambda: old_remove_all(make(size), 'x')) + \
+            elapsed(lambda: old_remove_where(make(size),
+                                             lambda v: v == 0))
+        new = elapsed(lambda: make(size).remove_all('x')) + \
+            elapsed(lambda: make(size).remove_where(lambda v: v == 0))
+        print(f'{size:>10}: поочерёдно {old:>8.3f}s, '
+              f'сжатие {new:>8.3f}s')
+
+    print(f'\n{large} элементов, сжатие:')
+    for name, method in (
+            ('remove_all', lambda data: data.remove_all('x')),
+            ('remove_by_type', lambda data: data.remove_by_type(str)),
+            ('filter', lambda data: data.filter(lambda v: v != 'x')),
+            ('remove_where', lambda data: data.remove_where(
+                lambda v: v == 'x')),
+            ('partition', lambda data: data.partition(
+                lambda v: v == 'x'))):
+        data = make(large)
+        print(f'{name:>15}: {elapsed(lambda: method(data)):>8.3f}s')
+
+
+def run_ring(sizes=(1000, 10000, 100000), appends: int = 200000):
+    print(f'\n{appends} добавлений в заполненный буфер:')
+    for size in sizes:
+        limited = SuperiorList(range(size)).limit(size, 'drop_oldest')
+
+        def shift():
+            for value in range(appends):
+                limited.append(value)
+
+        ring = SuperiorList(range(size)).ring(size)
+
+        def push():
+            for value in range(appends):
+                ring.append(value)
+
+        old, new = elapsed(shift), elapsed(push)
+        snapshot = elapsed(ring.snapshot)
+        print(f'{size:>10}: limit() {old:>7.3f}s, '
+              f'ring() {new:>7.3f}s, snapshot {snapshot * 1000:>7.2f}ms')
+
+
+def run_indexing(size: int = 1000, reads: int = 1000000):
+    print(f'\n{reads} чтений и записей по индексу:')
+    plain = list(range(size))
+    for name, data in (('list', plain),
+                       ('SuperiorList', SuperiorList(plain)),
+                       ('limit()', SuperiorList(plain).limit(size * 2))):
+        def access():
+            for i in range(reads):
+                data[i % size] = data[i % size]
+
+        print(f'{name:>15}: {elapsed(access):>8.3f}s')
+
+
+if __name__ == '__main__':
+    run()
+    run_ring()
+    run_indexing()
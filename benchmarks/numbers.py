@@ -0,0 +1,52 @@
+"""
+WeakInt и CorrectFloat: стоимость операций по сравнению с int и float.
+
+Запуск из корня проекта:
+    python -m benchmarks.numbers
+"""
+import math
+import timeit
+
+from data_types.float import CorrectFloat
+from data_types.int import WeakInt
+
+
+def old_add(a: float, b: float) -> float:
+    """
+    Прежний CorrectFloat.__add__: кол-во цифр через str().split('.').
+    """
+    len_number = len(str(a).split('.')[1])
+    len_part = len(str(b).split('.')[1])
+    return CorrectFloat(round(float(a) + b, len_number + len_part))
+
+
+def per_call(func, number: int = 200000) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e9
+
+
+def run():
+    w, i = WeakInt(7), 7
+    c, f = CorrectFloat(19.99), 19.99
+    cases = (
+        ('WeakInt()', lambda: WeakInt(300), lambda: int(300)),
+        ('WeakInt small', lambda: w._create_class(5), lambda: int(5)),
+        ('WeakInt.pow', w.pow, lambda: i ** 2),
+        ('WeakInt.sqrt', w.sqrt, lambda: int(i ** 0.5)),
+        ('WeakInt.sin', w.sin, lambda: math.sin(i * math.pi / 180)),
+        ('WeakInt.log', w.log, lambda: math.log(i, 2)),
+        ('WeakInt.reverse', w.reverse, lambda: int(str(i)[::-1])),
+        ('CorrectFloat + float', lambda: c + 0.01, lambda: f + 0.01),
+        ('прежний + float', lambda: old_add(c, 0.01), lambda: f + 0.01),
+        ('CorrectFloat + int', lambda: c + 1, lambda: f + 1),
+        ('CorrectFloat.pow', c.pow, lambda: f ** 2),
+        ('CorrectFloat.sqrt', c.sqrt, lambda: f ** 0.5),
+        ('CorrectFloat.sin', c.sin, lambda: math.sin(f * math.pi / 180)),
+    )
+    print(f'{"операция":>22} {"класс, нс":>10} {"builtin, нс":>12} {"x":>6}')
+    for name, ours, builtin in cases:
+        a, b = per_call(ours), per_call(builtin)
+        print(f'{name:>22} {a:>10.0f} {b:>12.0f} {a / b:>6.1f}')
+
+
+if __name__ == '__main__':
+    run()
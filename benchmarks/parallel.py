@@ -0,0 +1,58 @@
+"""
+Ускорение apply_rule с разными исполнителями на правилах,
+ограниченных вводом-выводом и процессором.
+
+Запуск из корня проекта:
+    python -m benchmarks.parallel
+"""
+import asyncio
+import time
+
+from data_types.list import SuperiorList
+
+
+def io_rule(value: int) -> int:
+    time.sleep(0.002)
+    return value
+
+
+async def async_io_rule(value: int) -> int:
+    await asyncio.sleep(0.002)
+    return value
+
+
+def cpu_rule(value: int) -> int:
+    return sum(i * i for i in range(20000)) + value
+
+
+def elapsed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(io_size: int = 500, cpu_size: int = 200):
+    cases = (
+        ('ввод-вывод', io_size, (
+            ('последовательно', io_rule, None),
+            ('thread', io_rule, 'thread'),
+            ('asyncio', async_io_rule, 'asyncio'),
+        )),
+        ('процессор', cpu_size, (
+            ('последовательно', cpu_rule, None),
+            ('thread', cpu_rule, 'thread'),
+            ('process', cpu_rule, 'process'),
+        )),
+    )
+    for title, size, executors in cases:
+        print(f'Правило: {title}, {size} элементов')
+        base = None
+        for name, rule, executor in executors:
+            data = SuperiorList(range(size))
+            spent = elapsed(lambda: data.apply_rule(rule, executor=executor))
+            base = base or spent
+            print(f'{name:>16}: {spent:.3f}s (x{base / spent:.1f})')
+
+
+if __name__ == '__main__':
+    run()
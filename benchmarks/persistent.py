@@ -0,0 +1,88 @@
+"""
+Версии конфигурации: ModifiableTuple против PersistentVector.
+
+Каждая версия получается из предыдущей одним изменением (замена
+значения, добавление или удаление последнего), и все версии хранятся.
+
+Запуск из корня проекта:
+    python -m benchmarks.persistent
+"""
+import random
+import time
+import tracemalloc
+
+from data_types.tuple import ModifiableTuple
+
+
+def tuple_set(data: ModifiableTuple, index: int, value):
+    return ModifiableTuple(data[:index] + (value,) + data[index + 1:])
+
+
+def tuple_pop(data: ModifiableTuple):
+    return ModifiableTuple(data[:-1])
+
+
+def make_changes(size: int, versions: int):
+    random.seed(0)
+    changes, length = [], size
+    for _ in range(versions):
+        kind = random.choice(('set', 'set', 'append', 'pop'))
+        if kind == 'pop' and length <= 1:
+            kind = 'append'
+        length += {'set': 0, 'append': 1, 'pop': -1}[kind]
+        changes.append((kind, random.randrange(length), random.random()))
+    return changes
+
+
+def history(first, changes, set_, append, pop):
+    versions = [first]
+    current = first
+    for kind, index, value in changes:
+        if kind == 'set':
+            current = set_(current, index, value)
+        elif kind == 'append':
+            current = append(current, value)
+        else:
+            current = pop(current)
+        versions.append(current)
+    return versions
+
+
+def measure(func):
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        result = func()
+        spent = time.perf_counter() - start
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, spent, size
+
+
+def run(sizes=(1000, 10000, 100000), versions: int = 2000):
+    for size in sizes:
+        changes = make_changes(size, versions)
+        base = ModifiableTuple(range(size))
+        print(f'\nКонфигурация из {size} значений, {versions} версий:')
+        cases = (
+            ('ModifiableTuple', lambda: history(
+                base, changes, tuple_set,
+                lambda data, value: data.append(value), tuple_pop)),
+            ('PersistentVector', lambda: history(
+                base.persistent(), changes,
+                lambda data, index, value: data.set(index, value),
+                lambda data, value: data.append(value),
+                lambda data: data.pop())),
+        )
+        results = []
+        for name, func in cases:
+            result, spent, memory = measure(func)
+            results.append(result[-1])
+            print(f'{name:>17}: {spent:>7.3f}s, '
+                  f'{memory / 2 ** 20:>8.1f} MiB на все версии')
+        assert tuple(results[0]) == tuple(results[1])
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,62 @@
+"""
+Простые числа: прежний цикл WeakInt.is_prime против data_types.primes.
+
+Запуск из корня проекта:
+    python -m benchmarks.primes
+"""
+import time
+
+from data_types import primes
+from data_types.int import WeakInt
+
+
+def old_is_prime(number: WeakInt) -> bool:
+    """
+    Прежний WeakInt.is_prime: пробное деление до int(sqrt()).
+    """
+    if number < 2:
+        return False
+    for i in range(2, int(number.sqrt()) + 1):
+        if number % i == 0:
+            return False
+    return True
+
+
+def elapsed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(limit: int = 200000):
+    numbers = [WeakInt(i) for i in range(limit)]
+    print(f'Проверка всех чисел до {limit}:')
+    for name, func in (
+            ('прежний цикл', lambda: [old_is_prime(n) for n in numbers]),
+            ('WeakInt.is_prime', lambda: [n.is_prime() for n in numbers]),
+            ('is_prime_many', lambda: primes.is_prime_many(numbers)),
+            ('primes_in_range', lambda: primes.primes_in_range(0, limit))):
+        print(f'{name:>18}: {elapsed(func):>8.3f}s')
+
+
+def run_large():
+    prime = WeakInt(1000000000039)
+    print('\nБольшие числа:')
+    print(f'{"прежний цикл 1e12":>26}: '
+          f'{elapsed(lambda: old_is_prime(prime)):>8.3f}s')
+    for value in (prime, WeakInt(2 ** 61 - 1), WeakInt(2 ** 127 - 1),
+                  WeakInt(2 ** 521 - 1)):
+        spent = elapsed(lambda: value.is_prime())
+        print(f'{f"is_prime {value.bit_length()} бит":>26}: {spent:>8.5f}s')
+    semiprime = WeakInt((2 ** 31 - 1) * 1000000007)
+    print(f'{"factorize 61 бит":>26}: '
+          f'{elapsed(semiprime.factorize):>8.5f}s '
+          f'{semiprime.factorize()}')
+    start = 10 ** 12
+    spent = elapsed(lambda: primes.primes_in_range(start, start + 10 ** 6))
+    print(f'{"primes_in_range 1e12+1e6":>26}: {spent:>8.3f}s')
+
+
+if __name__ == '__main__':
+    run()
+    run_large()
@@ -0,0 +1,68 @@
+"""
+Память и время longest_common_substring: матрица ДП против
+суффиксного автомата.
+
+Запуск из корня проекта:
+    python -m benchmarks.substring
+"""
+import random
+import time
+import tracemalloc
+
+from data_types.substring import (longest_common_substring,
+                                  longest_common_substring_many)
+
+
+def matrix_lcs(a: str, b: str) -> str:
+    """
+    Прежняя реализация WeakStr.longest_common_substring.
+    """
+    m = [[0] * (1 + len(b)) for _ in range(1 + len(a))]
+    longest, x_longest = 0, 0
+    for x in range(1, 1 + len(a)):
+        for y in range(1, 1 + len(b)):
+            if a[x - 1] == b[y - 1]:
+                m[x][y] = m[x - 1][y - 1] + 1
+                if m[x][y] > longest:
+                    longest = m[x][y]
+                    x_longest = x
+            else:
+                m[x][y] = 0
+    return a[x_longest - longest: x_longest]
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+
+def random_text(length: int) -> str:
+    return ''.join(random.choice('abcdefgh ') for _ in range(length))
+
+
+def run(lengths=(500, 1000, 2000), large=(10000, 50000)):
+    random.seed(0)
+    print(f'{"длина":>7} {"матрица":>22} {"автомат":>22}')
+    for length in lengths:
+        a, b = random_text(length), random_text(length)
+        old_time, old_peak = measure(matrix_lcs, a, b)
+        new_time, new_peak = measure(longest_common_substring, a, b)
+        print(f'{length:>7} {old_time:>9.3f}s {old_peak:>9.2f}MiB '
+              f'{new_time:>9.3f}s {new_peak:>9.2f}MiB')
+    for length in large:
+        a, b = random_text(length), random_text(length)
+        new_time, new_peak = measure(longest_common_substring, a, b)
+        print(f'{length:>7} {"-":>22} {new_time:>9.3f}s {new_peak:>9.2f}MiB')
+
+    strings = [random_text(20000) for _ in range(5)]
+    elapsed, peak = measure(longest_common_substring_many, strings)
+    print(f'\n5 строк по 20000: {elapsed:.3f}s {peak:.2f}MiB')
+
+
+if __name__ == '__main__':
+    run()
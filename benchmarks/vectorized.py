@@ -0,0 +1,54 @@
+"""
+Тригонометрия, логарифм и степени над коллекцией: метод каждого
+WeakInt/CorrectFloat против функций data_types.vectorized.
+
+Запуск из корня проекта:
+    python -m benchmarks.vectorized
+"""
+import random
+import time
+
+from data_types import vectorized
+from data_types.float import CorrectFloat
+from data_types.list import SuperiorList
+
+
+def elapsed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def run(size: int = 1000000):
+    random.seed(0)
+    angles = SuperiorList(CorrectFloat(round(random.uniform(1, 360), 2))
+                          for _ in range(size))
+    backend = 'NumPy' if vectorized.np is not None else 'math'
+    print(f'{size} значений, векторный путь: {backend}')
+    cases = (
+        ('sin', lambda: [value.sin() for value in angles],
+         lambda: vectorized.sin_many(angles)),
+        ('cos', lambda: [value.cos() for value in angles],
+         lambda: vectorized.cos_many(angles)),
+        ('tan', lambda: [value.tan() for value in angles],
+         lambda: vectorized.tan_many(angles)),
+        ('log', lambda: [value.log() for value in angles],
+         lambda: vectorized.log_many(angles)),
+        ('pow', lambda: [value.pow() for value in angles],
+         lambda: vectorized.pow_many(angles)),
+        ('sqrt', lambda: [value.sqrt() for value in angles],
+         lambda: vectorized.sqrt_many(angles)),
+    )
+    for name, scalar, vector in cases:
+        expected, scalar_time = elapsed(scalar)
+        result, vector_time = elapsed(vector)
+        assert all(abs(a - b) <= 1e-9 * max(1.0, abs(a))
+                   for a, b in zip(expected, result))
+        print(f'{name:>5}: по одному {scalar_time:.3f}s, '
+              f'коллекцией {vector_time:.3f}s, '
+              f'x{scalar_time / vector_time:.1f}, '
+              f'{size / vector_time / 1e6:.1f} млн/с')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import threading
+from typing import Dict, Iterable, List
+
+from errors.error import IntervalError
+
+DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+MIN_BASE, MAX_BASE = 2, len(DIGITS)
+
+# Основания, для которых встроенные format() и int() работают
+# за линейное время.
+_FORMATS = {2: 'b', 8: 'o', 16: 'X'}
+_LINEAR = (2, 4, 8, 16, 32)
+
+# Записи до такой длины в основаниях до 36 быстрее разобрать
+# встроенным int().
+_DIRECT_DIGITS = 1000
+# Числа до такой длины в битах переводятся без разбиения.
+_DIRECT_BITS = 1024
+
+_VALUES = {digit: value for value, digit in enumerate(DIGITS)}
+
+# Для каждого основания: степени base ** (leaf * 2 ** i), число цифр
+# в листе разбиения и записи всех пар цифр.
+_powers: Dict[int, List[int]] = {}
+_leaves: Dict[int, int] = {}
+_pairs: Dict[int, List[str]] = {}
+# Допустимые цифры для каждого основания.
+_allowed: Dict[int, frozenset] = {}
+_lock = threading.Lock()
+
+
+def to_base(number: int, base: int) -> str:
+    """
+    Возвращает запись числа в системе счисления base (2-62).
+
+    Цифры: 0-9, затем A-Z, затем a-z. Число делится пополам по
+    степеням base ** (leaf * 2 ** i) из кеша, поэтому для чисел
+    из тысяч цифр выполняется O(log n) больших делений вместо
+    деления на base для каждой цифры.
+
+    Args:
+        number (int): целое число, в том числе отрицательное.
+        base (int): основание системы счисления.
+
+    Returns:
+        str: запись числа.
+    """
+    _check_base(base)
+    if number < 0:
+        return '-' + to_base(-number, base)
+    if base in _FORMATS:
+        return format(number, _FORMATS[base])
+    if number.bit_length() <= _DIRECT_BITS:
+        return _small_to_base(number, base, 0)
+    powers = _powers_for(base, number)
+    parts = []
+    _write(number, len(powers) - 1, base, powers, parts, False)
+    return ''.join(parts)
+
+
+def from_base(digits: str, base: int) -> int:
+    """
+    Возвращает число по его записи в системе счисления base (2-62).
+
+    Запись делится пополам, и половины собираются как
+    high * base ** len(low) + low, поэтому работа приходится
+    на быстрое (Карацуба) умножение больших чисел. Для оснований
+    до 36 регистр букв не важен.
+
+    Args:
+        digits (str): запись числа, возможно со знаком.
+        base (int): основание системы счисления.
+
+    Returns:
+        int: число.
+    """
+    _check_base(base)
+    digits = digits.strip()
+    sign = 1
+    if digits[:1] in ('-', '+'):
+        sign = -1 if digits[0] == '-' else 1
+        digits = digits[1:]
+    if not digits:
+        raise ValueError("Пустая запись числа")
+    if base <= 36:
+        digits = digits.upper()
+    # Проверка идёт до int(), чтобы короткие записи не принимали
+    # синтаксис int() ('0x1F', '1_000', цифры других алфавитов).
+    _check_digits(digits, base)
+    if base <= 36 and (len(digits) <= _DIRECT_DIGITS or base in _LINEAR):
+        return sign * int(digits, base)
+    levels = max(0, (len(digits) - 1) // _leaf(base)).bit_length()
+    powers = _extend_powers(base, lambda cache: len(cache) < levels)
+    return sign * _read(digits, base, powers)
+
+
+def to_base_many(numbers: Iterable[int], base: int) -> List[str]:
+    """
+    Переводит множество чисел в систему счисления base.
+    Степени основания вычисляются один раз для наибольшего числа.
+    """
+    numbers = list(numbers)
+    if numbers:
+        _powers_for(base, max(abs(number) for number in numbers))
+    return [to_base(number, base) for number in numbers]
+
+
+def from_base_many(values: Iterable[str], base: int) -> List[int]:
+    """
+    Переводит множество записей из системы счисления base в числа.
+    """
+    return [from_base(value, base) for value in values]
+
+
+def _check_base(base: int) -> None:
+    if not MIN_BASE <= base <= MAX_BASE:
+        raise IntervalError(
+            "Основание должно быть от %d до %d: %d"
+            % (MIN_BASE, MAX_BASE, base))
+
+
+def _check_digits(digits: str, base: int) -> None:
+    allowed = _allowed.get(base)
+    if allowed is None:
+        allowed = _allowed[base] = frozenset(DIGITS[:base])
+    if allowed.issuperset(digits):
+        return
+    for digit in digits:
+        if digit not in allowed:
+            raise ValueError(
+                "Недопустимая цифра для основания %d: %r" % (base, digit))
+
+
+def _leaf(base: int) -> int:
+    """
+    Число цифр в листе разбиения: такие числа помещаются в 60 бит
+    и переводятся напрямую.
+    """
+    leaf = _leaves.get(base)
+    if leaf is None:
+        leaf = _leaves[base] = max(1, 60 // base.bit_length())
+    return leaf
+
+
+def _powers_for(base: int, number: int) -> List[int]:
+    """
+    Возвращает степени base ** (leaf * 2 ** i), не превосходящие
+    number, дополнив кеш при необходимости.
+    """
+    powers = _powers.get(base)
+    if powers is None or powers[-1] <= number:
+        powers = _extend_powers(base, lambda cache: cache[-1] <= number)
+    count = 0
+    while count < len(powers) and powers[count] <= number:
+        count += 1
+    return powers[:count]
+
+
+def _extend_powers(base: int, needs_more) -> List[int]:
+    """
+    Дописывает в кеш степеней base новые степени, пока needs_more
+    возвращает истину, и возвращает кеш.
+    """
+    with _lock:
+        powers = _powers.get(base)
+        if powers is None:
+            powers = _powers[base] = [base ** _leaf(base)]
+        while needs_more(powers):
+            powers.append(powers[-1] * powers[-1])
+        return powers
+
+
+def _write(number: int, level: int, base: int, powers: List[int],
+           parts: List[str], pad: bool) -> None:
+    """
+    Дописывает в parts цифры number < powers[level + 1]. При pad
+    запись дополняется нулями до leaf * 2 ** (level + 1) цифр.
+    """
+    if level < 0:
+        parts.append(_small_to_base(number, base, _leaf(base) if pad
+                                    else 0))
+        return
+    high, low = divmod(number, powers[level])
+    if high or pad:
+        _write(high, level - 1, base, powers, parts, pad)
+    _write(low, level - 1, base, powers, parts, bool(high) or pad)
+
+
+def _small_to_base(number: int, base: int, width: int) -> str:
+    """
+    Переводит небольшое число, снимая по две цифры за шаг.
+    """
+    if base == 10:
+        return str(number).rjust(width, '0')
+    pairs = _pairs.get(base)
+    if pairs is None:
+        pairs = _pairs[base] = [DIGITS[high] + DIGITS[low]
+                                for high in range(base)
+                                for low in range(base)]
+    square = base * base
+    parts = []
+    while number:
+        number, remainder = divmod(number, square)
+        parts.append(pairs[remainder])
+    digits = ''.join(reversed(parts)).lstrip('0')
+    return digits.rjust(width or 1, '0')
+
+
+def _read(digits: str, base: int, powers: List[int]) -> int:
+    leaf = _leaf(base)
+    if len(digits) <= leaf:
+        if base <= 36:
+            return int(digits, base)
+        value = 0
+        for digit in digits:
+            value = value * base + _VALUES[digit]
+        return value
+    level = 0
+    while leaf << (level + 1) < len(digits):
+        level += 1
+    split = len(digits) - (leaf << level)
+    return _read(digits[:split], base, powers) * powers[level] + \
+        _read(digits[split:], base, powers)
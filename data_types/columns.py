@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from data_types.patterns import (CREDIT_CARD_PATTERN, EMAIL_PATTERN,
+                                 NUMBER_PATTERN)
+from errors.error import IntervalError
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_CHUNKSIZE = 65536
+
+
+def check_emails(chunk: List[str]) -> List[bool]:
+    """
+    Аналог WeakStr.is_valid_email для списка строк.
+    """
+    match = EMAIL_PATTERN.match
+    return [match(value) is not None for value in chunk]
+
+
+def mask_credit_cards(chunk: List[str]) -> List[str]:
+    """
+    Аналог WeakStr.mask_credit_card для списка строк.
+    """
+    sub = CREDIT_CARD_PATTERN.sub
+    return [sub(r'\1XXXXXXXXX\2', value) for value in chunk]
+
+
+def find_numbers(chunk: List[str]) -> List[List[int]]:
+    """
+    Аналог WeakStr.extract_numbers для списка строк.
+    """
+    findall = NUMBER_PATTERN.findall
+    return [[int(x) for x in findall(value)] for value in chunk]
+
+
+def map_chunks(worker: Callable[[List[str]], list], values: Iterable[str],
+               chunksize: int = DEFAULT_CHUNKSIZE,
+               processes: Optional[int] = None) -> Iterator[list]:
+    """
+    Применяет worker к значениям пачками по chunksize штук
+    и лениво возвращает результаты пачек по порядку.
+
+    Входные данные читаются постепенно, поэтому подходят генераторы
+    и файлы. При processes > 1 пачки обрабатываются в пуле процессов,
+    в работе одновременно не больше 2 * processes пачек.
+
+    Args:
+        worker (Callable): функция, обрабатывающая список строк,
+         например check_emails. Для пула процессов должна быть
+         объявлена на уровне модуля.
+        values (Iterable[str]): строки, список или массив NumPy.
+        chunksize (int): размер пачки.
+        processes (Optional[int]): число процессов.
+
+    Returns:
+        Iterator[list]: результаты пачек.
+    """
+    if not chunksize > 0:
+        raise IntervalError("chunksize должно быть > 0: %d" % chunksize)
+    chunks = _split(values, chunksize)
+    if not processes or processes <= 1:
+        for chunk in chunks:
+            yield worker(chunk)
+        return
+
+    with ProcessPoolExecutor(processes) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(worker, chunk))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def is_valid_email_many(values: Iterable[str],
+                        chunksize: int = DEFAULT_CHUNKSIZE,
+                        processes: Optional[int] = None):
+    """
+    Проверяет столбец строк на корректность адресов электронной почты.
+
+    Returns:
+        List[bool] или булев массив NumPy, если передан массив NumPy.
+    """
+    result = _collect(check_emails, values, chunksize, processes)
+    if _is_array(values):
+        return np.array(result, dtype=bool)
+    return result
+
+
+def mask_credit_card_many(values: Iterable[str],
+                          chunksize: int = DEFAULT_CHUNKSIZE,
+                          processes: Optional[int] = None):
+    """
+    Маскирует номера кредитных карт в столбце строк.
+
+    Returns:
+        List[str] или строковый массив NumPy, если передан массив NumPy.
+    """
+    result = _collect(mask_credit_cards, values, chunksize, processes)
+    if _is_array(values):
+        return np.array(result, dtype=str)
+    return result
+
+
+def extract_numbers_many(values: Iterable[str],
+                         chunksize: int = DEFAULT_CHUNKSIZE,
+                         processes: Optional[int] = None
+                         ) -> List[List[int]]:
+    """
+    Извлекает числа из каждой строки столбца.
+
+    Returns:
+        List[List[int]]: списки чисел в порядке строк.
+    """
+    return _collect(find_numbers, values, chunksize, processes)
+
+
+def _collect(worker: Callable, values: Iterable[str], chunksize: int,
+             processes: Optional[int]) -> list:
+    result = []
+    for chunk_result in map_chunks(worker, values, chunksize, processes):
+        result.extend(chunk_result)
+    return result
+
+
+def _split(values: Iterable[str], chunksize: int) -> Iterator[List[str]]:
+    if _is_array(values):
+        for start in range(0, len(values), chunksize):
+            yield values[start:start + chunksize].tolist()
+        return
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _is_array(values) -> bool:
+    return np is not None and isinstance(values, np.ndarray)
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import MutableSequence
+from typing import Any, Iterable, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TYPECODES = {int: 'q', float: 'd'}
+
+_INT64_LIMIT = 2 ** 63
+
+
+class CompactList(MutableSequence):
+    """
+    Список чисел в компактном хранилище.
+
+    Пока все элементы одного типа (int или float), они лежат в
+    array.array: 8 байт на элемент вместо указателя и отдельного
+    объекта. sum, avg, max и min в этом режиме считаются в NumPy
+    поверх того же буфера без копирования (или встроенными функциями,
+    если NumPy не установлен).
+
+    При добавлении значения другого типа список один раз и незаметно
+    для вызывающего переходит к обычному хранилищу объектов. Пустой
+    список выбирает хранилище заново по первым добавленным значениям.
+
+    Применение:
+        values = CompactList([1.5, 2.5, 3.0])
+        values.typecode  # 'd'
+        values.sum()  # 7.0
+        values.append('x')
+        values.typecode  # None, дальше это обычный список
+    """
+
+    def __init__(self, values: Iterable = ()):
+        self._data, self._type = self._build(values)
+
+    @property
+    def typecode(self) -> Optional[str]:
+        """
+        Код типа array.array или None в режиме хранения объектов.
+        """
+        if self._type is None:
+            return None
+        return self._data.typecode
+
+    @property
+    def is_compact(self) -> bool:
+        return self._type is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._data
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            result = self.__class__.__new__(self.__class__)
+            result._data, result._type = self._data[index], self._type
+            return result
+        return self._data[index]
+
+    def __setitem__(self, index: Union[int, slice], value: Any) -> None:
+        if isinstance(index, slice) and not self._data:
+            self._data, self._type = self._build(value)
+            return
+        if self._type is not None:
+            if isinstance(index, slice):
+                value = list(value)
+                if self._fits_all(value):
+                    self._data[index] = array(self._data.typecode, value)
+                    return
+            elif type(value) is self._type and self._in_range(value):
+                self._data[index] = value
+                return
+            self._to_objects()
+        self._data[index] = value
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        del self._data[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CompactList):
+            other = other._data
+        elif not isinstance(other, (list, tuple, array)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self._data, other))
+
+    def __repr__(self) -> str:
+        return '{name}({values!r})'.format(name=self.__class__.__name__,
+                                           values=list(self._data))
+
+    def __reduce__(self):
+        return self.__class__, (list(self._data),)
+
+    def insert(self, index: int, value: Any) -> None:
+        if not self._data:
+            self._data, self._type = self._build([value])
+            return
+        if self._type is not None and not (type(value) is self._type
+                                           and self._in_range(value)):
+            self._to_objects()
+        self._data.insert(index, value)
+
+    def append(self, value: Any) -> None:
+        if not self._data:
+            self._data, self._type = self._build([value])
+            return
+        if self._type is not None and not (type(value) is self._type
+                                           and self._in_range(value)):
+            self._to_objects()
+        self._data.append(value)
+
+    def extend(self, values: Iterable) -> None:
+        if not self._data:
+            self._data, self._type = self._build(values)
+            return
+        if isinstance(values, CompactList):
+            values = values._data
+        if self._type is not None:
+            if isinstance(values, array) and \
+                    values.typecode == self._data.typecode:
+                self._data.extend(values)
+                return
+            values = list(values)
+            if self._fits_all(values):
+                self._data.extend(values)
+                return
+            self._to_objects()
+        self._data.extend(values)
+
+    def clear(self) -> None:
+        del self._data[:]
+
+    def sum(self) -> Union[int, float]:
+        """
+        Возвращает сумму элементов.
+
+        Целые числа суммируются в NumPy только если сумма заведомо
+        помещается в int64, иначе - точно, встроенной sum.
+        """
+        if self._use_numpy():
+            buffer = self._buffer()
+            if self._type is float or \
+                    len(buffer) * self._magnitude(buffer) < _INT64_LIMIT:
+                return buffer.sum().item()
+        return sum(self._data)
+
+    def avg(self) -> float:
+        return self.sum() / len(self)
+
+    def max(self) -> Union[int, float, Any]:
+        if self._use_numpy():
+            return self._buffer().max().item()
+        return max(self._data)
+
+    def min(self) -> Union[int, float, Any]:
+        if self._use_numpy():
+            return self._buffer().min().item()
+        return min(self._data)
+
+    def len(self) -> int:
+        return len(self)
+
+    def tolist(self) -> list:
+        return list(self._data)
+
+    def to_numpy(self, copy: bool = True):
+        """
+        Возвращает элементы массивом NumPy.
+
+        Args:
+            copy (bool): при False в компактном режиме возвращается
+             представление того же буфера без копирования. Пока оно
+             существует, размер списка менять нельзя (append, extend,
+             insert и удаление вызовут BufferError), а запись через
+             него меняет список.
+        """
+        if np is None:
+            raise ImportError("Для to_numpy нужен NumPy")
+        if self._type is None:
+            return np.array(self._data)
+        buffer = self._buffer()
+        return buffer.copy() if copy else buffer
+
+    def nbytes(self) -> int:
+        """
+        Возвращает примерный объём памяти данных в байтах: буфер
+        array.array или список указателей вместе с объектами.
+        """
+        if self._type is not None:
+            return self._data.buffer_info()[1] * self._data.itemsize
+        return len(self._data) * 8 + sum(
+            value.__sizeof__() for value in self._data)
+
+    def _use_numpy(self) -> bool:
+        return np is not None and self._type is not None and \
+            len(self._data) > 0
+
+    def _buffer(self):
+        return np.frombuffer(self._data, dtype=self._data.typecode)
+
+    @staticmethod
+    def _magnitude(buffer) -> int:
+        return max(abs(buffer.min().item()), abs(buffer.max().item()))
+
+    def _fits_all(self, values: list) -> bool:
+        kind = self._type
+        return all(type(value) is kind for value in values) and \
+            all(map(self._in_range, values))
+
+    def _in_range(self, value: Any) -> bool:
+        return self._type is float or -_INT64_LIMIT <= value < _INT64_LIMIT
+
+    def _to_objects(self) -> None:
+        self._data, self._type = list(self._data), None
+
+    @staticmethod
+    def _build_from_numpy(values):
+        """
+        Хранилище для массива NumPy: знаковые целые и беззнаковые
+        до 32 бит приводятся к int64, вещественные до 64 бит - к
+        float64, в порядке байтов платформы. Остальное переводится
+        в объекты Python через tolist().
+        """
+        dtype = values.dtype
+        kind = None
+        if values.ndim == 1:
+            if dtype.kind == 'i' or (dtype.kind == 'u'
+                                     and dtype.itemsize < 8):
+                kind = int
+            elif dtype.kind == 'f' and dtype.itemsize <= 8:
+                kind = float
+        if kind is None:
+            return CompactList._build(values.tolist())
+        data = array(TYPECODES[kind])
+        data.frombytes(values.astype('=' + TYPECODES[kind],
+                                     copy=False).tobytes())
+        return data, kind
+
+    @staticmethod
+    def _build(values: Iterable):
+        """
+        Подбирает хранилище для значений: array.array, если все они
+        одного числового типа, иначе список.
+        """
+        if isinstance(values, CompactList):
+            return values._data[:], values._type
+        if isinstance(values, array) and values.typecode in ('q', 'd'):
+            return array(values.typecode, values), \
+                int if values.typecode == 'q' else float
+        if np is not None and isinstance(values, np.ndarray):
+            return CompactList._build_from_numpy(values)
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        if not values:
+            return array(TYPECODES[float]), float
+        kind = type(values[0])
+        if kind not in TYPECODES or \
+                not all(type(value) is kind for value in values):
+            return list(values), None
+        try:
+            return array(TYPECODES[kind], values), kind
+        except OverflowError:
+            return list(values), None
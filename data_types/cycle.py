@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import Any, Iterable, Iterator, List
+
+from errors.error import IntervalError
+
+_DONE = object()
+
+
+class CycleIterator:
+    """
+    Бесконечный перебор коллекции по кругу со своей остановкой.
+
+    Каждый проход идёт встроенным итератором коллекции, поэтому
+    изменения списка видны со следующего элемента, а индексация
+    и len() на каждом шаге не нужны. Перебор завершается, когда
+    проход не дал ни одного элемента: для пустой коллекции (вместо
+    IndexError) и для одноразового итератора или генератора после
+    первого прохода.
+
+    Если передано несколько коллекций, элементы берутся из них
+    по очереди (round robin), и каждая коллекция перебирается
+    по кругу независимо от остальных.
+
+    Применение:
+        numbers = CycleIterator([1, 2, 3])
+        numbers.take(5)  # [1, 2, 3, 1, 2]
+        for value in numbers:
+            if value == 3:
+                numbers.stop()
+
+        CycleIterator('ab', [1, 2, 3]).take(6)  # ['a', 1, 'b', 2, 'a', 3]
+    """
+
+    def __init__(self, *collections: Iterable):
+        self._collections = collections
+        self._stopped = False
+        if len(collections) == 1:
+            self._generator = self._cycle(collections[0])
+        else:
+            self._generator = self._round_robin(collections)
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped
+
+    def __iter__(self) -> Iterator:
+        return self._generator
+
+    def __next__(self) -> Any:
+        return next(self._generator)
+
+    def stop(self) -> None:
+        """
+        Останавливает перебор: следующий шаг вызовет StopIteration.
+        """
+        self._stopped = True
+        try:
+            self._generator.close()
+        except ValueError:
+            # Генератор выполняется в другом потоке, он остановится
+            # сам на следующем проходе.
+            pass
+
+    def take(self, count: int) -> List[Any]:
+        """
+        Возвращает следующие count элементов одним списком.
+        """
+        if count < 0:
+            raise IntervalError("count должно быть >= 0: %d" % count)
+        return list(islice(self._generator, count))
+
+    def batches(self, size: int) -> Iterator[List[Any]]:
+        """
+        Лениво возвращает элементы списками по size штук.
+        """
+        if not size > 0:
+            raise IntervalError("size должно быть > 0: %d" % size)
+        return iter(lambda: self.take(size), [])
+
+    def _cycle(self, collection: Iterable) -> Iterator:
+        while not self._stopped:
+            iterator = iter(collection)
+            first = next(iterator, _DONE)
+            if first is _DONE:
+                return
+            yield first
+            yield from iterator
+
+    def _round_robin(self, collections: tuple) -> Iterator:
+        active = [self._cycle(collection) for collection in collections]
+        while active:
+            for iterator in tuple(active):
+                value = next(iterator, _DONE)
+                if value is _DONE:
+                    active.remove(iterator)
+                else:
+                    yield value
@@ -1,49 +1,276 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Hashable
+import sys
+from abc import abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from typing import Any, Callable, Hashable, Iterator, Optional, Union
 
+from data_types.parallel import map_ordered
+from errors.error import CycleError, MismatchType
 from func.chatGPT import analyze_file
 
 
+_HOLE = object()  # Метка удалённого ключа в порядковом индексе
+
+
+def _item_value(item: tuple) -> Any:
+    """
+    Ключ сортировки по умолчанию: значение пары (ключ, значение).
+    """
+    return item[1]
+
+
+_ITEM = 'item'  # Событие обхода: пара ключ-значение
+_EXIT = 'exit'  # Событие обхода: вложенный словарь пройден
+
+
+def _walk(root: dict, unique: bool = True) -> Iterator[tuple]:
+    """
+    Итеративный обход вложенных словарей с явным стеком.
+
+    Возвращает события (событие, путь, словарь, ключ, значение):
+        _ITEM - для каждой пары ключ-значение (путь - ключи до словаря);
+        _EXIT - после обхода словаря и всех его потомков
+         (словарь передаётся третьим элементом, ключ и значение - None).
+
+    Путь - общий изменяемый список, его нужно копировать,
+    если он нужен после следующего события.
+
+    Args:
+        root (dict): корневой словарь.
+        unique (bool): заходить в каждый вложенный словарь один раз,
+         даже если на него ссылаются несколько ветвей.
+
+    Raises:
+        CycleError: если словарь (косвенно) содержит сам себя.
+    """
+    path = []
+    on_path = {id(root)}
+    visited = {id(root)}
+    stack = [(root, iter(dict.items(root)))]
+    while stack:
+        node, items = stack[-1]
+        for key, value in items:
+            yield _ITEM, path, node, key, value
+            if not isinstance(value, dict):
+                continue
+            if id(value) in on_path:
+                raise CycleError(
+                    "Словарь содержит сам себя по ключу {key!r}".format(
+                        key=key)
+                )
+            if unique and id(value) in visited:
+                continue
+            visited.add(id(value))
+            on_path.add(id(value))
+            path.append(key)
+            stack.append((value, iter(dict.items(value))))
+            break
+        else:
+            stack.pop()
+            on_path.discard(id(node))
+            yield _EXIT, path, node, None, None
+            if path:
+                path.pop()
+
+
+def _assign(mapping: dict, key: Hashable, value: Any) -> None:
+    """
+    Записывает значение в словарь; в IndexDict - минуя трактовку
+    int-ключей как индексов.
+    """
+    if isinstance(mapping, IndexDict):
+        mapping._store(key, value)
+    else:
+        mapping[key] = value
+
+
+def _copy_dicts(root: dict) -> dict:
+    """
+    Копирует дерево вложенных словарей; остальные значения остаются
+    общими. Общий для нескольких ветвей словарь копируется один раз.
+    """
+    copies = {id(root): {}}
+    for event, _, node, key, value in _walk(root):
+        if event is _ITEM:
+            if isinstance(value, dict):
+                value = copies.setdefault(id(value), {})
+            copies[id(node)][key] = value
+    return copies[id(root)]
+
+
+def _split_path(path: Union[str, Sequence], separator: str) -> list:
+    if isinstance(path, str):
+        return path.split(separator) if path else []
+    return list(path)
+
+
+class IndexDictView(Sequence):
+    """
+    Живое представление ключей, значений или пар IndexDict.
+
+    Не копирует словарь: итерация идёт по встроенному представлению
+    dict, а доступ по индексу - через порядковый индекс IndexDict.
+    Срез возвращает кортеж элементов среза.
+    """
+
+    __slots__ = ('_mapping',)
+
+    def __init__(self, mapping: IndexDict):
+        self._mapping = mapping
+
+    def __len__(self) -> int:
+        return len(self._mapping)
+
+    def __iter__(self) -> Iterator:
+        return self._source()
+
+    def __reversed__(self) -> Iterator:
+        return self._source(reverse=True)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self._element(self._mapping._key_at(i))
+                         for i in range(len(self))[index])
+        return self._element(self._mapping._key_at(index))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, IndexDictView):
+            other = tuple(other)
+        return tuple(self) == other
+
+    def __repr__(self) -> str:
+        return '{name}({items!r})'.format(name=self.__class__.__name__,
+                                          items=tuple(self))
+
+    @abstractmethod
+    def _source(self, reverse: bool = False) -> Iterator:
+        """
+        Итератор элементов представления в порядке позиций.
+        """
+
+    @abstractmethod
+    def _element(self, key: Hashable):
+        """
+        Элемент представления для ключа key.
+        """
+
+
+class IndexDictKeys(IndexDictView):
+    __slots__ = ()
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._mapping
+
+    def _source(self, reverse: bool = False) -> Iterator:
+        return self._mapping._iter_keys(reverse)
+
+    def _element(self, key: Hashable):
+        return key
+
+
+class IndexDictValues(IndexDictView):
+    __slots__ = ()
+
+    def _source(self, reverse: bool = False) -> Iterator:
+        mapping = self._mapping
+        if mapping._sorted is None:
+            values = dict.values(mapping)
+            return reversed(values) if reverse else iter(values)
+        return map(mapping._raw_get, mapping._iter_keys(reverse))
+
+    def _element(self, key: Hashable):
+        return dict.__getitem__(self._mapping, key)
+
+
+class IndexDictItems(IndexDictView):
+    __slots__ = ()
+
+    def __contains__(self, item: Any) -> bool:
+        return item in dict.items(self._mapping)
+
+    def _source(self, reverse: bool = False) -> Iterator:
+        mapping = self._mapping
+        if mapping._sorted is None:
+            items = dict.items(mapping)
+            return reversed(items) if reverse else iter(items)
+        return ((key, mapping._raw_get(key))
+                for key in mapping._iter_keys(reverse))
+
+    def _element(self, key: Hashable):
+        return key, dict.__getitem__(self._mapping, key)
+
+
 class IndexDict(dict):
     """
     Класс-наследник dict, добавляет индексирование.
 
     Добавляет методы для работы со словарем по индексу
     и применение правила на все элементы словаря.
+
+    Порядок ключей дублируется в списке _order, поэтому доступ
+    по индексу не копирует словарь. Удалённые ключи заменяются
+    меткой _HOLE, позиции меток хранятся в отсортированном списке
+    _holes. Когда меток становится больше половины списка,
+    он уплотняется.
+
+    По запросу (enable_value_index) словарь ведёт обратный индекс
+    значение -> ключи, с которым поиск и удаление по значению
+    затрагивают только совпавшие элементы.
+
+    В режиме keep_index_sorted порядок позиций задаёт функция
+    сортировки:
+    _order хранит ключи по возрастанию, а параллельный список
+    _sort_keys - их ключи сортировки для bisect.
     """
 
-    def keys(self) -> tuple:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._by_value = None
+        self._unhashable = None
+        self._sorted = None
+        self._reset_order()
+
+    def keys(self) -> IndexDictKeys:
         """
-        Возвращает кортеж из ключей словаря.
+        Возвращает живое представление ключей словаря
+        с доступом по индексу и срезу.
         """
-        return tuple(super().keys())
+        return IndexDictKeys(self)
 
-    def values(self) -> tuple:
+    def values(self) -> IndexDictValues:
         """
-        Возвращает кортеж из значений словаря.
+        Возвращает живое представление значений словаря
+        с доступом по индексу и срезу.
         """
-        return tuple(super().values())
+        return IndexDictValues(self)
 
-    def items(self) -> tuple:
+    def items(self) -> IndexDictItems:
         """
-        Возвращает кортеж из пар ключ-значение словаря
+        Возвращает живое представление пар ключ-значение словаря
+        с доступом по индексу и срезу.
         """
-        return tuple(super().items())
+        return IndexDictItems(self)
 
     def __getitem__(self, key):
         """
         Переопределяет метод для доступа к элементу словаря по индексу.
         """
         if isinstance(key, slice):
-            element_from_key = list(self.items())[key]
-            after_slicing = element_from_key[key]
-            return self.__class__(after_slicing)
+            return self.__class__(
+                (k, dict.__getitem__(self, k))
+                for k in map(self._key_at, range(len(self))[key])
+            )
         if self.get(key):
             return self.__class__({key: super().__getitem__(key)})
         if isinstance(key, int):
-            element_from_key = list(self.items())[key]
-            return self.__class__({element_from_key[0]: element_from_key[1]})
+            element_key = self._key_at(key)
+            return self.__class__(
+                {element_key: super().__getitem__(element_key)}
+            )
         raise KeyError("Элемент или индекс не найдены!")
 
     def __setitem__(self, key: Hashable, value: Any) -> None:
@@ -51,12 +278,113 @@ class IndexDict(dict):
         Переопределяет метод для задания значения элемента словаря по индексу.
         """
         if isinstance(key, int):
-            elements = list(map(lambda i: [i[0], i[1]], self.items()))
-            if key <= len(elements):
-                super().__setitem__(elements[key][0], value)
-                return
-            raise IndexError("Index out of range")
-        super().__setitem__(key, value)
+            self._store(self._key_at(key), value)
+            return
+        self._store(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._forget_key(key)
+        super().__delitem__(key)
+
+    def __reduce__(self):
+        state = {'value_index': self._by_value is not None,
+                 'sorted': self._sorted}
+        if self._sorted is None:
+            items = list(dict.items(self))
+        else:
+            items = [(key, self._raw_get(key)) for key in self._order]
+        return self.__class__, (items,), state
+
+    def __setstate__(self, state: dict) -> None:
+        if state.get('sorted'):
+            self.keep_index_sorted(*state['sorted'])
+        if state.get('value_index'):
+            self.enable_value_index()
+
+    def pop(self, key: Hashable, *default):
+        if key in self:
+            self._forget_key(key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple:
+        if not self:
+            raise KeyError('popitem(): dictionary is empty')
+        key = self._key_at(-1)
+        return key, self.pop(key)
+
+    def clear(self) -> None:
+        super().clear()
+        self._reset_order()
+        if self._by_value is not None:
+            self.enable_value_index()
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self._store(key, value)
+
+    def __ior__(self, other) -> IndexDict:
+        self.update(other)
+        return self
+
+    def setdefault(self, key: Hashable, default: Any = None) -> Any:
+        if key not in self:
+            self._store(key, default)
+        return super().__getitem__(key)
+
+    def copy(self) -> IndexDict:
+        cls, args, state = self.__reduce__()
+        new = cls(*args)
+        new.__setstate__(state)
+        return new
+
+    def enable_value_index(self) -> None:
+        """
+        Строит и далее поддерживает обратный индекс значение -> ключи.
+
+        Ускоряет remove_first_by_value, remove_all_by_value и
+        keys_for_value до O(k) для k совпадений. Стоит памяти
+        (см. value_index_size) и времени на каждой записи.
+        Значения, которые нельзя хешировать, не индексируются
+        и просматриваются при каждом поиске.
+        """
+        self._by_value = {}
+        self._unhashable = {}
+        for key, value in dict.items(self):
+            self._link_value(key, value)
+
+    def disable_value_index(self) -> None:
+        """
+        Отключает обратный индекс и освобождает занятую им память.
+        """
+        self._by_value = self._unhashable = None
+
+    @property
+    def value_index_enabled(self) -> bool:
+        return self._by_value is not None
+
+    def value_index_size(self) -> int:
+        """
+        Возвращает примерный размер обратного индекса в байтах
+        (0, если индекс отключён).
+        """
+        if self._by_value is None:
+            return 0
+        return (sys.getsizeof(self._by_value)
+                + sys.getsizeof(self._unhashable)
+                + sum(map(sys.getsizeof, self._by_value.values())))
+
+    def keys_for_value(self, value: Any) -> list:
+        """
+        Возвращает ключи с заданным значением в порядке словаря.
+
+        Args:
+            value (Any): искомое значение.
+        """
+        if self._by_value is None:
+            return [k for k, meaning in self.items() if meaning == value]
+        return sorted(self._indexed_keys(value), key=self._position)
 
     def remove_by_index(self, index: int = -1) -> None:
         """
@@ -66,11 +394,8 @@ class IndexDict(dict):
             index (int): индекс удаляемого элемента (-1 по умолчанию)
         """
         if isinstance(index, int):
-            elements = list(map(lambda i: [i[0], i[1]], self.items()))
-            if index <= len(elements):
-                self.pop(elements[index][0])
-                return
-            raise IndexError("Index out of range")
+            self.pop(self._key_at(index))
+            return
         raise KeyError("Index not found")
 
     def remove_first_by_value(self, value: Any) -> None:
@@ -80,9 +405,14 @@ class IndexDict(dict):
         Args:
             value (Any): Значение для удаления (удаляет первое вхождение)
         """
-        for key, meaning in enumerate(self.values()):
+        if self._by_value is not None:
+            keys = self._indexed_keys(value)
+            if keys:
+                self.pop(min(keys, key=self._position))
+            return
+        for key, meaning in self.items():
             if meaning == value:
-                self.remove_by_index(key)
+                self.pop(key)
                 return
 
     def remove_all_by_value(self, value: Any) -> None:
@@ -92,9 +422,11 @@ class IndexDict(dict):
         Args:
             value (Any): Значение для удаления (удаляет все вхождения)
         """
-        for key, meaning in enumerate(self.values()):
-            if meaning == value:
-                self.remove_by_index(key)
+        if self._by_value is not None:
+            keys = self._indexed_keys(value)
+        else:
+            keys = [k for k, meaning in self.items() if meaning == value]
+        self._remove_keys(keys)
 
     def check_depth(self) -> int:
         """
@@ -106,63 +438,443 @@ class IndexDict(dict):
     def _depth(cls, _dict) -> int:
         """
         Вспомогательный метод для определения глубины словаря.
-        Работает через рекурсию.
+        Работает итеративно: высота каждого вложенного словаря
+        вычисляется один раз, при выходе из него.
 
         Args:
             _dict (dict): словарь у которого определяется глубина
         """
-        if isinstance(_dict, dict):
-            return 1 + (max(map(cls._depth, _dict.values())) if _dict else 0)
-        return 0
+        if not isinstance(_dict, dict):
+            return 0
+        heights = {}
+        for event, _, node, _, _ in _walk(_dict):
+            if event is _EXIT:
+                heights[id(node)] = 1 + max(
+                    (heights[id(v)] for v in dict.values(node)
+                     if isinstance(v, dict)),
+                    default=0,
+                )
+        return heights[id(_dict)]
 
-    def apply_rule(self, rule: Callable) -> IndexDict:
+    def apply_rule(self, rule: Callable,
+                   executor: Union[str, Executor, None] = None,
+                   chunksize: Optional[int] = None,
+                   workers: Optional[int] = None) -> IndexDict:
         """
         Применяет заданную функцию ко всем значениям словаря.
 
+        Если задан executor, значения обрабатываются параллельно
+        (см. data_types.parallel.map_ordered), а словарь меняется только
+        если функция отработала без ошибок.
+
         Args:
             rule (Callable): функция для применения
+            executor (Union[str, Executor, None]): 'thread', 'process',
+             'asyncio' или concurrent.futures.Executor.
+            chunksize (Optional[int]): размер пачки значений.
+            workers (Optional[int]): число исполнителей.
         """
-        for k, v in self.items():
-            self[k] = rule(v)
+        if executor is None:
+            # В режиме keep_index_sorted запись двигает элементы, поэтому
+            # обходится снимок пар.
+            items = self.items() if self._sorted is None else \
+                list(self.items())
+            for k, v in items:
+                self._store(k, rule(v))
+            return self
+        results = map_ordered(rule, self.values(), executor, chunksize,
+                              workers)
+        for k, v in zip(list(self.keys()), results):
+            self._store(k, v)
         return self
 
     def apply_rule_depth(self, rule: Callable) -> IndexDict:
         """
         Применяет заданное правило ко всем значениям словаря во всех вложенных уровнях.
 
+        Значения вложенных словарей заменяются на месте,
+        общий для нескольких ветвей словарь обрабатывается один раз.
+
         Args:
             rule (Callable): функция для применения
         """
-        return self._recursion_rule(self, rule)
+        for event, _, parent, key, value in _walk(self):
+            if event is _ITEM and not isinstance(value, dict):
+                _assign(parent, key, rule(value))
+        return self
 
-    def _recursion_rule(self, _dict, func: Callable) -> IndexDict:
+    def flatten(self, separator: str = '.') -> IndexDict:
         """
-        Вспомогательный метод для применения правила
-        ко всем значениям словаря во всех вложенных уровнях.
+        Возвращает плоский словарь: путь из ключей через separator
+        -> значение. Пустые вложенные словари остаются значениями.
+
+        Args:
+            separator (str): разделитель ключей в пути.
         """
-        for k, v in _dict.items():
-            if isinstance(v, dict):
-                self[k] = self._recursion_rule(v, func)
-            else:
-                self[k] = func(v)
-        return _dict
+        result = self.__class__()
+        for event, path, _, key, value in _walk(self, unique=False):
+            if event is _ITEM and not (isinstance(value, dict) and value):
+                result._store(separator.join(map(str, path + [key])), value)
+        return result
+
+    def deep_get(self, path: Union[str, Sequence], default: Any = None,
+                 separator: str = '.') -> Any:
+        """
+        Возвращает значение по пути во вложенных словарях.
+
+        Args:
+            path (Union[str, Sequence]): путь 'a.b.c' или
+             последовательность ключей.
+            default (Any): значение, если путь не найден.
+            separator (str): разделитель ключей в строковом пути.
+        """
+        node = self
+        for key in _split_path(path, separator):
+            if not isinstance(node, dict) or key not in node:
+                return default
+            node = dict.__getitem__(node, key)
+        return node
+
+    def deep_set(self, path: Union[str, Sequence], value: Any,
+                 separator: str = '.') -> None:
+        """
+        Задаёт значение по пути, создавая недостающие словари.
+
+        Args:
+            path (Union[str, Sequence]): путь 'a.b.c' или
+             последовательность ключей.
+            value (Any): новое значение.
+            separator (str): разделитель ключей в строковом пути.
+        """
+        keys = _split_path(path, separator)
+        if not keys:
+            raise KeyError("Путь не может быть пустым")
+        node = self
+        for key in keys[:-1]:
+            if key not in node:
+                _assign(node, key, {})
+            node = dict.__getitem__(node, key)
+            if not isinstance(node, dict):
+                raise MismatchType(
+                    "По ключу {key!r} лежит не словарь".format(key=key)
+                )
+        _assign(node, keys[-1], value)
+
+    def deep_merge(self, other: dict) -> IndexDict:
+        """
+        Сливает other в текущий словарь: вложенные словари сливаются,
+        остальные значения перезаписываются значениями из other.
+        Вложенные словари other, которых нет в текущем, копируются,
+        поэтому дальнейшие изменения не затрагивают other.
 
-    def sort(self, key: Callable = lambda x: x[1],
+        Args:
+            other (dict): словарь, который вливается в текущий.
+        """
+        stack = [(self, other)]
+        merged = set()
+        while stack:
+            target, source = stack.pop()
+            if (id(target), id(source)) in merged:
+                continue
+            merged.add((id(target), id(source)))
+            for key, value in dict.items(source):
+                current = dict.get(target, key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                elif isinstance(value, dict):
+                    _assign(target, key, _copy_dicts(value))
+                else:
+                    _assign(target, key, value)
+        return self
+
+    def sort(self, key: Callable = _item_value,
              reverse: bool = False) -> IndexDict:
         """
-        Сортирует словарь по заданному ключу
+        Сортирует словарь по заданному ключу на месте.
+
+        В режиме keep_index_sorted меняет функцию сортировки режима.
 
         Args:
             key (Callable): функция для сортировки
             reverse (bool): перевернуть результат
+
+        Returns:
+            IndexDict: этот же словарь.
         """
-        sorted_data = sorted(self.items(), key=key)
-        if reverse:
-            sorted_data = sorted_data[::-1]
-        self.clear()
-        for key, value in sorted_data:
-            self[key] = value
-        return self.__class__(sorted_data)
+        if self._sorted is not None:
+            if self._sorted != (key, reverse):
+                self.keep_index_sorted(key, reverse)
+        else:
+            sorted_data = sorted(dict.items(self), key=key)
+            if reverse:
+                sorted_data.reverse()
+            super().clear()
+            super().update(sorted_data)
+            self._reset_order()
+        self.sync_order()
+        return self
+
+    def keep_index_sorted(self, key: Callable = _item_value,
+                          reverse: bool = False) -> IndexDict:
+        """
+        Включает режим, в котором позиции элементов всегда
+        упорядочены по key.
+
+        Новые и изменённые элементы встают на место бинарным поиском,
+        поэтому полная пересортировка не нужна. Сортировке следуют
+        только позиционные операции: индексы, срезы, rank и
+        представления keys/values/items (а через них и json.dumps).
+        Сам dict (for key in d, repr, dict(d), {**d}) остаётся
+        в порядке вставки, пока не вызван sync_order(), sort() или
+        stop_index_sorted().
+
+        Значения не должны менять ключ сортировки на месте
+        (например, изменяемые списки): меняйте их через d[key] = value.
+
+        Args:
+            key (Callable): функция от пары (ключ, значение)
+            reverse (bool): порядок по убыванию
+        """
+        pairs = sorted(((key(item), item[0]) for item in dict.items(self)),
+                       key=itemgetter(0))
+        self._sorted = (key, reverse)
+        self._sort_keys = [pair[0] for pair in pairs]
+        self._order = [pair[1] for pair in pairs]
+        self._slots = {}
+        self._holes = []
+        return self
+
+    def stop_index_sorted(self) -> IndexDict:
+        """
+        Выключает режим keep_index_sorted, сохраняя текущий порядок.
+        """
+        if self._sorted is not None:
+            self.sync_order()
+            self._sorted = None
+            self._reset_order()
+        return self
+
+    def rank(self, key: Hashable) -> int:
+        """
+        Возвращает позицию ключа за O(log n).
+
+        Args:
+            key (Hashable): ключ словаря.
+        """
+        if key not in self:
+            raise KeyError(key)
+        return self._position(key)
+
+    def range_by_position(self, start: int, stop: int) -> tuple:
+        """
+        Возвращает пары ключ-значение с позиций [start, stop).
+        """
+        return self.items()[start:stop]
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """
+        Задаёт значение по ключу, не трактуя int как индекс.
+        """
+        if key in self:
+            old = dict.__getitem__(self, key)
+            if self._by_value is not None:
+                self._unlink_value(key, old)
+            if self._sorted is not None:
+                self._unplace(key, old)
+        elif self._sorted is None:
+            self._slots[key] = len(self._order)
+            self._order.append(key)
+        super().__setitem__(key, value)
+        if self._by_value is not None:
+            self._link_value(key, value)
+        if self._sorted is not None:
+            self._place(key, value)
+
+    def _remove_keys(self, keys: list) -> None:
+        """
+        Удаляет набор ключей за один проход: позиции помечаются
+        сразу, а порядковый индекс уплотняется не больше одного раза.
+        """
+        if len(keys) < 2:
+            for key in keys:
+                self.pop(key)
+            return
+        if self._sorted is not None:
+            removing = set(keys)
+            for key in keys:
+                if self._by_value is not None:
+                    self._unlink_value(key, dict.__getitem__(self, key))
+                super().__delitem__(key)
+            pairs = [pair for pair in zip(self._sort_keys, self._order)
+                     if pair[1] not in removing]
+            self._sort_keys = [pair[0] for pair in pairs]
+            self._order = [pair[1] for pair in pairs]
+            return
+        order, positions = self._order, []
+        for key in keys:
+            if self._by_value is not None:
+                self._unlink_value(key, dict.__getitem__(self, key))
+            position = self._slots.pop(key)
+            order[position] = _HOLE
+            positions.append(position)
+            super().__delitem__(key)
+        self._holes = sorted(self._holes + positions)
+        self._trim_order()
+
+    def _indexed_keys(self, value: Any) -> list:
+        """
+        Ключи с заданным значением по обратному индексу.
+        """
+        try:
+            keys = list(self._by_value.get(value, ()))
+        except TypeError:
+            keys = []
+        keys.extend(k for k in self._unhashable
+                    if dict.__getitem__(self, k) == value)
+        return keys
+
+    def _link_value(self, key: Hashable, value: Any) -> None:
+        try:
+            self._by_value.setdefault(value, {})[key] = None
+        except TypeError:
+            self._unhashable[key] = None
+
+    def _unlink_value(self, key: Hashable, value: Any) -> None:
+        try:
+            keys = self._by_value[value]
+        except TypeError:
+            del self._unhashable[key]
+            return
+        del keys[key]
+        if not keys:
+            del self._by_value[value]
+
+    def _key_at(self, index: int) -> Hashable:
+        """
+        Возвращает ключ, стоящий на позиции index.
+        """
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Index out of range")
+        if self._sorted is not None:
+            return self._order[size - 1 - index if self._sorted[1]
+                               else index]
+        holes = self._holes
+        if not holes:
+            return self._order[index]
+        # Число меток перед искомой позицией: первая метка k,
+        # для которой holes[k] - k > index.
+        low, high = 0, len(holes)
+        while low < high:
+            middle = (low + high) // 2
+            if holes[middle] - middle > index:
+                high = middle
+            else:
+                low = middle + 1
+        return self._order[index + low]
+
+    def _forget_key(self, key: Hashable) -> None:
+        """
+        Убирает ключ из порядкового и обратного индексов.
+        Вызывается до удаления ключа из словаря.
+        """
+        value = dict.__getitem__(self, key)
+        if self._by_value is not None:
+            self._unlink_value(key, value)
+        if self._sorted is not None:
+            self._unplace(key, value)
+            return
+        position = self._slots.pop(key)
+        self._order[position] = _HOLE
+        insort(self._holes, position)
+        self._trim_order()
+
+    def _trim_order(self) -> None:
+        """
+        Отбрасывает метки в конце порядкового индекса и уплотняет его,
+        если меток больше половины.
+        """
+        order, holes = self._order, self._holes
+        while holes and holes[-1] == len(order) - 1:
+            order.pop()
+            holes.pop()
+        if len(holes) > len(order) // 2:
+            self._compact_order()
+
+    def _compact_order(self) -> None:
+        self._order = [key for key in self._order if key is not _HOLE]
+        self._slots = {key: i for i, key in enumerate(self._order)}
+        self._holes = []
+
+    def _position(self, key: Hashable) -> int:
+        """
+        Возвращает позицию существующего ключа за O(log n).
+        """
+        if self._sorted is None:
+            slot = self._slots[key]
+            return slot - bisect_left(self._holes, slot)
+        key_function, reverse = self._sorted
+        position = self._locate(key, key_function((key, self._raw_get(key))))
+        return len(self) - 1 - position if reverse else position
+
+    def _place(self, key: Hashable, value: Any) -> None:
+        sort_key = self._sorted[0]((key, value))
+        position = bisect_right(self._sort_keys, sort_key)
+        self._sort_keys.insert(position, sort_key)
+        self._order.insert(position, key)
+
+    def _unplace(self, key: Hashable, value: Any) -> None:
+        position = self._locate(key, self._sorted[0]((key, value)))
+        del self._sort_keys[position]
+        del self._order[position]
+
+    def _locate(self, key: Hashable, sort_key: Any) -> int:
+        """
+        Находит позицию ключа в _order среди равных ключей сортировки.
+        """
+        order = self._order
+        start = bisect_left(self._sort_keys, sort_key)
+        stop = bisect_right(self._sort_keys, sort_key, start)
+        for position in range(start, stop):
+            if order[position] == key:
+                return position
+        # Ключ сортировки значения изменился на месте.
+        return order.index(key)
+
+    def _iter_keys(self, reverse: bool = False) -> Iterator:
+        """
+        Ключи в порядке позиций (или в обратном).
+        """
+        if self._sorted is None:
+            keys = dict.keys(self)
+            return reversed(keys) if reverse else iter(keys)
+        if reverse != self._sorted[1]:
+            return reversed(self._order)
+        return iter(self._order)
+
+    def _raw_get(self, key: Hashable) -> Any:
+        return dict.__getitem__(self, key)
+
+    def sync_order(self) -> IndexDict:
+        """
+        Перестраивает сам dict в порядке позиций за O(n), чтобы обход
+        словаря, repr и dict(d) совпали с режимом keep_index_sorted.
+        """
+        if self._sorted is not None:
+            items = [(key, self._raw_get(key)) for key in self._iter_keys()]
+            super().clear()
+            super().update(items)
+        return self
+
+    def _reset_order(self) -> None:
+        if self._sorted is not None:
+            self.keep_index_sorted(*self._sorted)
+            return
+        self._order = list(dict.keys(self))
+        self._slots = {key: i for i, key in enumerate(self._order)}
+        self._holes = []
 
 
 if __name__ == '__main__':
@@ -0,0 +1,417 @@
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from errors.error import IntervalError
+
+# Длина шаблона, до которой битово-параллельный режим остаётся быстрым
+# (шаблон помещается в одно машинное слово).
+BIT_PARALLEL_MAX_PATTERN = 64
+
+
+def levenshtein(a: str, b: str, max_distance: Optional[int] = None,
+                bit_parallel: bool = False) -> int:
+    """
+    Вычисляет расстояние Левенштейна между a и b.
+
+    Использует итеративное ДП по полосе шириной 2 * max_distance + 1
+    (алгоритм Укконена) и хранит только две строки матрицы,
+    поэтому память линейна от длины более короткой строки.
+
+    Args:
+        a (str): первая строка.
+        b (str): вторая строка.
+        max_distance (Optional[int]): порог расстояния. Если расстояние
+         больше порога, вычисление останавливается досрочно и
+         возвращается max_distance + 1.
+        bit_parallel (bool): использовать битово-параллельный алгоритм
+         Майерса, если более короткая строка не длиннее
+         BIT_PARALLEL_MAX_PATTERN символов.
+
+    Returns:
+        int: расстояние или max_distance + 1, если порог превышен.
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if max_distance is not None:
+        max_distance = int(max_distance)
+        if len(a) - len(b) > max_distance:
+            return max_distance + 1
+
+    # Общие префикс и суффикс не влияют на расстояние.
+    start = 0
+    while start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+
+    if not b:
+        return len(a)
+    if bit_parallel and len(b) <= BIT_PARALLEL_MAX_PATTERN:
+        return bit_parallel_levenshtein(b, a, max_distance)
+    return _banded_levenshtein(a, b, max_distance)
+
+
+def bit_parallel_levenshtein(pattern: str, text: str,
+                             max_distance: Optional[int] = None) -> int:
+    """
+    Вычисляет расстояние Левенштейна битово-параллельным алгоритмом
+    Майерса (в формулировке Хюрё).
+
+    Один столбец матрицы ДП хранится в виде битовых масок,
+    поэтому на каждый символ 'text' приходится несколько
+    операций над целыми числами. Эффективно для коротких шаблонов.
+
+    Args:
+        pattern (str): шаблон (желательно более короткая строка).
+        text (str): текст.
+        max_distance (Optional[int]): порог расстояния, см. levenshtein.
+
+    Returns:
+        int: расстояние или max_distance + 1, если порог превышен.
+    """
+    if not pattern:
+        return _limit(len(text), max_distance)
+    if not text:
+        return _limit(len(pattern), max_distance)
+
+    peq = {}
+    for i, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    mask = (1 << len(pattern)) - 1
+    last = 1 << (len(pattern) - 1)
+    pv, mv = mask, 0
+    score = len(pattern)
+    remaining = len(text)
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & mask
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        remaining -= 1
+        # Счёт уменьшается не более чем на 1 за символ.
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+    return _limit(score, max_distance)
+
+
+def _banded_levenshtein(a: str, b: str,
+                        max_distance: Optional[int] = None) -> int:
+    """
+    ДП по полосе вокруг диагонали. Ожидает, что len(a) >= len(b) > 0.
+    """
+    n, m = len(a), len(b)
+    k = n if max_distance is None else min(max_distance, n)
+    big = k + 1
+
+    prev = [j if j <= k else big for j in range(m + 1)]
+    cur = [big] * (m + 1)
+    for i in range(1, n + 1):
+        lo = max(1, i - k)
+        hi = min(m, i + k)
+        cur[lo - 1] = i if lo == 1 and i <= k else big
+        row_min = cur[lo - 1]
+        char = a[i - 1]
+        for j in range(lo, hi + 1):
+            value = prev[j - 1] + (char != b[j - 1])
+            if prev[j] + 1 < value:
+                value = prev[j] + 1
+            if cur[j - 1] + 1 < value:
+                value = cur[j - 1] + 1
+            if value > big:
+                value = big
+            cur[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > k:
+            return big
+        prev, cur = cur, prev
+    return prev[m] if prev[m] <= k else big
+
+
+def _limit(distance: int, max_distance: Optional[int]) -> int:
+    if max_distance is not None and distance > max_distance:
+        return max_distance + 1
+    return distance
+
+
+class FuzzyIndex:
+    """
+    Индекс строк для быстрого нечёткого поиска по расстоянию Левенштейна.
+
+    Слова разложены по длине, а внутри длины - по n-граммам и по
+    символам (инвертированный индекс). Если расстояние до запроса
+    не больше k, то длины отличаются не больше чем на k, у слова
+    остаётся хотя бы L - gram_size + 1 - gram_size * k общих n-грамм
+    с запросом и хотя бы L - k общих символов, где L - длина более
+    длинной из двух строк. Для каждой длины используется n-граммный
+    фильтр, если его порог положителен, иначе символьный, который
+    работает при любом cutoff < 1. Точное расстояние считается только
+    для слов, прошедших фильтры.
+
+    close_matches ищет с растущим порогом расстояния и
+    останавливается, как только найдено n слов, поэтому для
+    запросов с близкими словами далёкие порог и кандидаты
+    не перебираются.
+
+    Поддерживает добавление и удаление слов без перестроения.
+
+    Применение:
+        index = FuzzyIndex(['apple', 'apply', 'ape'])
+        WeakStr('appel').get_close_matches(index)
+    """
+
+    def __init__(self, words: Iterable[str] = (), gram_size: int = 2,
+                 bit_parallel: bool = False):
+        if gram_size < 1:
+            raise IntervalError("gram_size должно быть > 0: %d" % gram_size)
+        self.gram_size = gram_size
+        self.bit_parallel = bit_parallel
+        self._ids = {}
+        self._words = []
+        self._counts = []
+        self._free = []
+        self._by_length = {}
+        self._postings = {}
+        self._size = 0
+        for word in words:
+            self.insert(word)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        for word, count in zip(self._words, self._counts):
+            for _ in range(count):
+                yield word
+
+    def insert(self, word: str) -> None:
+        """
+        Добавляет слово в индекс.
+
+        Args:
+            word (str): добавляемое слово.
+        """
+        self._size += 1
+        word_id = self._ids.get(word)
+        if word_id is not None:
+            self._counts[word_id] += 1
+            return
+        if self._free:
+            word_id = self._free.pop()
+            self._words[word_id] = word
+            self._counts[word_id] = 1
+        else:
+            word_id = len(self._words)
+            self._words.append(word)
+            self._counts.append(1)
+        self._ids[word] = word_id
+        self._by_length.setdefault(len(word), {})[word_id] = None
+        for gram, count in self._all_grams(word).items():
+            key = (len(word), gram)
+            self._postings.setdefault(key, {})[word_id] = count
+
+    def remove(self, word: str) -> None:
+        """
+        Удаляет одно вхождение слова из индекса.
+
+        Args:
+            word (str): удаляемое слово.
+        """
+        word_id = self._ids.get(word)
+        if word_id is None:
+            raise KeyError(word)
+        self._size -= 1
+        self._counts[word_id] -= 1
+        if self._counts[word_id]:
+            return
+        del self._ids[word]
+        self._words[word_id] = None
+        self._free.append(word_id)
+        self._discard(self._by_length, len(word), word_id)
+        for gram in self._all_grams(word):
+            self._discard(self._postings, (len(word), gram), word_id)
+
+    def search(self, word: str,
+               max_distance: float) -> List[Tuple[int, str]]:
+        """
+        Находит все слова на расстоянии не больше max_distance.
+
+        Args:
+            word (str): искомое слово.
+            max_distance (float): максимальное расстояние Левенштейна.
+
+        Returns:
+            List[Tuple[int, str]]: пары (расстояние, слово), слово
+             повторяется столько раз, сколько раз оно было добавлено.
+        """
+        max_distance = int(max_distance)
+        if max_distance < 0:
+            return []
+        size = self.gram_size
+        grams = self._grams(word, size)
+        chars = self._grams(word, 1)
+        result = []
+        for length in range(max(len(word) - max_distance, 0),
+                            len(word) + max_distance + 1):
+            candidates = self._by_length.get(length)
+            if not candidates:
+                continue
+            longest = max(len(word), length)
+            threshold = longest - size + 1 - size * max_distance
+            if threshold > 0:
+                candidates = self._count_filter(grams, length, threshold)
+            elif longest - max_distance > 0:
+                candidates = self._count_filter(chars, length,
+                                                longest - max_distance)
+            for word_id in candidates:
+                candidate = self._words[word_id]
+                distance = levenshtein(word, candidate, max_distance,
+                                       self.bit_parallel)
+                if distance <= max_distance:
+                    result.extend(
+                        [(distance, candidate)] * self._counts[word_id]
+                    )
+        return result
+
+    def close_matches(self, word: str, n: int = 3,
+                      cutoff: float = 0.6) -> List[str]:
+        """
+        Возвращает до n ближайших слов, как WeakStr.get_close_matches.
+
+        Args:
+            word (str): искомое слово.
+            n (int): максимальное число совпадений.
+            cutoff (float): доля длины слова, задающая
+             максимальное расстояние.
+
+        Returns:
+            List[str]: совпадения, отсортированные по расстоянию.
+        """
+        limit = int(len(word) * cutoff)
+        max_distance = 0
+        while True:
+            result = self.search(word, max_distance)
+            if len(result) >= n or max_distance >= limit:
+                break
+            max_distance = min(max(1, max_distance * 2), limit)
+        result.sort()
+        return [x[1] for x in result][:n]
+
+    def _count_filter(self, grams: dict, length: int,
+                      threshold: int) -> List[int]:
+        hits = {}
+        for gram, count in grams.items():
+            posting = self._postings.get((length, gram))
+            if not posting:
+                continue
+            for word_id, word_count in posting.items():
+                hits[word_id] = hits.get(word_id, 0) + min(count, word_count)
+        return [word_id for word_id, hit in hits.items() if hit >= threshold]
+
+    def _all_grams(self, word: str) -> dict:
+        """
+        n-граммы и символы слова (при gram_size == 1 они совпадают).
+        """
+        grams = self._grams(word, 1)
+        if self.gram_size > 1:
+            grams.update(self._grams(word, self.gram_size))
+        return grams
+
+    @staticmethod
+    def _grams(word: str, size: int) -> dict:
+        grams = {}
+        for i in range(len(word) - size + 1):
+            gram = word[i:i + size]
+            grams[gram] = grams.get(gram, 0) + 1
+        return grams
+
+    @staticmethod
+    def _discard(container: dict, key, word_id: int) -> None:
+        ids = container[key]
+        del ids[word_id]
+        if not ids:
+            del container[key]
+
+
+_worker_index = None
+
+
+def get_close_matches_many(queries: Iterable[str],
+                           possibilities: Union[Iterable[str], FuzzyIndex],
+                           n: int = 3, cutoff: float = 0.6,
+                           processes: Optional[int] = None,
+                           chunksize: Optional[int] = None,
+                           bit_parallel: bool = False) -> List[List[str]]:
+    """
+    Пакетный аналог WeakStr.get_close_matches для множества запросов.
+
+    Список возможностей один раз превращается в FuzzyIndex, который
+    передаётся каждому процессу пула при его запуске. Запросы
+    раздаются процессам пачками по chunksize штук.
+
+    Args:
+        queries (Iterable[str]): строки, для которых ищутся совпадения.
+        possibilities (Union[Iterable[str], FuzzyIndex]): общий для всех
+         запросов список строк или готовый индекс.
+        n (int): максимальное число совпадений на запрос.
+        cutoff (float): см. WeakStr.get_close_matches.
+        processes (Optional[int]): число процессов, по умолчанию
+         os.cpu_count(). При 1 поиск идёт в текущем процессе.
+        chunksize (Optional[int]): размер пачки запросов.
+        bit_parallel (bool): см. WeakStr.get_close_matches.
+
+    Returns:
+        List[List[str]]: результаты в порядке запросов.
+    """
+    if not n > 0:
+        raise IntervalError("n должно быть > 0: %d" % n)
+    if not 0.0 <= cutoff <= 1.0:
+        raise IntervalError("cutoff в промежутке [0.0, 1.0]: %r" % cutoff)
+
+    queries = list(queries)
+    index = possibilities
+    if not isinstance(index, FuzzyIndex):
+        index = FuzzyIndex(possibilities, bit_parallel=bit_parallel)
+    processes = processes or os.cpu_count() or 1
+    processes = min(processes, len(queries))
+    if processes <= 1:
+        return [index.close_matches(query, n, cutoff) for query in queries]
+
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(queries) / (processes * 4)))
+    with ProcessPoolExecutor(processes, initializer=_init_worker,
+                             initargs=(index,)) as executor:
+        tasks = ((query, n, cutoff) for query in queries)
+        return list(executor.map(_close_matches_worker, tasks,
+                                 chunksize=chunksize))
+
+
+def _init_worker(index: FuzzyIndex) -> None:
+    global _worker_index
+    _worker_index = index
+
+
+def _close_matches_worker(task: Tuple[str, int, float]) -> List[str]:
+    return _worker_index.close_matches(*task)
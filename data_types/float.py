@@ -1,8 +1,26 @@
 from __future__ import annotations
 
-from typing import Any, Union
+import math
+import re
+from itertools import islice
+from typing import Any, Iterable, Optional
 
 from data_types.int import _FunctionalNumbers
+from errors.error import IntervalError
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Сколько чисел хранит кеш кол-ва цифр после запятой.
+PLACES_CACHE_SIZE = 4096
+# Размер пачки, которую FloatAccumulator.extend суммирует math.fsum.
+FSUM_CHUNKSIZE = 4096
+
+_places_cache = {}
+
+_FRACTION_PATTERN = re.compile(r'\.(\d+)')
 
 
 class CorrectFloat(float, _FunctionalNumbers):
@@ -24,20 +42,168 @@ class CorrectFloat(float, _FunctionalNumbers):
         Returns:
             CorrectFloat
         """
+        if isinstance(other, float):
+            return self.__class__(round(
+                float.__add__(self, other),
+                _decimal_places(self) + _decimal_places(other)
+            ))
+
+        if isinstance(other, int):
+            return self.__class__(float.__add__(self, other))
+
         if isinstance(other, str) and other.isdigit():
             return self.__class__(super().__add__(self._create_class(other)))
 
-        if isinstance(other, int):
-            return self.__class__(super().__add__(other))
+        return super().__add__(other)
+
+    @classmethod
+    def fsum(cls, values: Iterable[float],
+             places: Optional[int] = None) -> CorrectFloat:
+        """
+        Складывает множество чисел с одним округлением в конце.
+
+        В отличие от цепочки a + b + ..., промежуточные суммы не
+        округляются и не переводятся в строку: значения суммируются
+        точно (math.fsum), а результат округляется до places знаков
+        после запятой.
 
-        len_number = self._get_len_number(self, 1)
-        len_part = self._get_len_number(other, 1)
-        return self._create_class(
-            round(super().__add__(other), len_number + len_part)
-        )
+        Args:
+            values (Iterable[float]): числа, в том числе генератор
+             или массив NumPy.
+            places (Optional[int]): знаков после запятой в результате.
+             По умолчанию - наибольшее их число среди значений.
 
-    def _get_len_number(self, number: Union[int, float], index: int = 0):
+        Returns:
+            CorrectFloat: сумма.
         """
-        Возвращает кол-во цифр до или после запятой (зависит от индекса).
+        if np is not None and isinstance(values, np.ndarray):
+            # Массив переводится в список float одним вызовом, дальше
+            # знаки считаются тем же правилом (repr), что и для списка.
+            values = values.astype(float, copy=False).ravel().tolist()
+        return cls(FloatAccumulator(values, places).value())
+
+
+class FloatAccumulator:
+    """
+    Накопитель суммы чисел с компенсацией ошибки округления.
+
+    Значения добавляются по одному (add, +=) или потоком (extend).
+    Сумма ведётся алгоритмом Неймайера: потерянные младшие разряды
+    копятся в отдельной поправке, поэтому ошибка не растёт с числом
+    слагаемых. Округление до нужного числа знаков - только в value().
+
+    Применение:
+        total = FloatAccumulator()
+        for price in prices:
+            total += price
+        total.value()  # CorrectFloat
+    """
+
+    def __init__(self, values: Iterable[float] = (),
+                 places: Optional[int] = None):
+        if places is not None and places < 0:
+            raise IntervalError("places должно быть >= 0: %d" % places)
+        self.places = places
+        self.count = 0
+        self._total = 0.0
+        self._compensation = 0.0
+        self._max_places = 0
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iadd__(self, value: float) -> FloatAccumulator:
+        self.add(value)
+        return self
+
+    def add(self, value: float) -> None:
+        """
+        Добавляет одно число.
+        """
+        value = float(value)
+        if self.places is None:
+            self._track_places(_decimal_places(value))
+        self._add(value)
+        self.count += 1
+
+    def extend(self, values: Iterable[float]) -> None:
+        """
+        Добавляет поток чисел. Каждая пачка из FSUM_CHUNKSIZE значений
+        суммируется точно (math.fsum) и добавляется как одно слагаемое.
         """
-        return len(str(number).split('.')[index])
+        iterator = iter(values)
+        while True:
+            chunk = list(map(float, islice(iterator, FSUM_CHUNKSIZE)))
+            if not chunk:
+                return
+            if self.places is None:
+                self._track_places(_max_places(chunk))
+            self._add(math.fsum(chunk))
+            self.count += len(chunk)
+
+    def value(self) -> CorrectFloat:
+        """
+        Возвращает сумму, округлённую до places знаков после запятой
+        (по умолчанию - до наибольшего их числа среди слагаемых).
+        """
+        places = self._max_places if self.places is None else self.places
+        return CorrectFloat(round(self._total + self._compensation, places))
+
+    def _add(self, value: float) -> None:
+        total = self._total + value
+        if not math.isfinite(total):
+            # Поправка для бесконечности дала бы inf - inf = nan.
+            self._total = total
+            return
+        if abs(self._total) >= abs(value):
+            self._compensation += (self._total - total) + value
+        else:
+            self._compensation += (value - total) + self._total
+        self._total = total
+
+    def _track_places(self, places: int) -> None:
+        if places > self._max_places:
+            self._max_places = places
+
+
+def _decimal_places(number: float) -> int:
+    """
+    Возвращает кол-во цифр после запятой в кратчайшей записи числа
+    (repr), учитывая экспоненциальную запись: 1.5e-07 -> 8.
+
+    Позиция запятой ищется в одной строке repr без split и списков,
+    а результат кешируется: в расчётах одни и те же цены и ставки
+    встречаются многократно. Подбор k через round(number, k) == number
+    проверялся: в CPython он медленнее одного repr.
+    """
+    places = _places_cache.get(number)
+    if places is not None:
+        return places
+    places = _count_places(repr(number))
+    if len(_places_cache) >= PLACES_CACHE_SIZE:
+        _places_cache.clear()
+    _places_cache[number] = places
+    return places
+
+
+def _max_places(values: list) -> int:
+    """
+    Возвращает наибольшее кол-во цифр после запятой среди чисел.
+    Записи склеиваются в одну строку и разбираются одним регулярным
+    выражением, без работы с каждым числом в Python.
+    """
+    text = ' '.join(map(repr, values))
+    if 'e' in text or 'n' in text:
+        return max(_count_places(repr(value)) for value in values)
+    return max(map(len, _FRACTION_PATTERN.findall(text)), default=0)
+
+
+def _count_places(text: str) -> int:
+    if 'e' not in text:
+        point = text.find('.')
+        return len(text) - point - 1 if point >= 0 else 0
+    mantissa, _, exponent = text.partition('e')
+    point = mantissa.find('.')
+    places = (len(mantissa) - point - 1 if point >= 0 else 0) - int(exponent)
+    return places if places > 0 else 0
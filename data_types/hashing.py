@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Union
+
+from errors.error import IntervalError
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+Source = Union[str, bytes, bytearray, memoryview, os.PathLike,
+               Iterable[bytes]]
+
+
+def hash_stream(source: Source, algorithm: str = 'sha256',
+                block_size: int = DEFAULT_BLOCK_SIZE) -> str:
+    """
+    Возвращает хеш-сумму данных, не загружая их в память целиком.
+
+    Args:
+        source (Source): путь к файлу (str или os.PathLike),
+         буфер (bytes, bytearray, memoryview) или итерируемый
+         объект с фрагментами байтов.
+        algorithm (str): алгоритм из hashlib.
+        block_size (int): размер блока при чтении файла и при
+         передаче буфера в hashlib.
+
+    Returns:
+        str: хеш-сумма в шестнадцатеричном виде.
+    """
+    if not block_size > 0:
+        raise IntervalError("block_size должно быть > 0: %d" % block_size)
+    h = hashlib.new(algorithm)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as file:
+            buffer = bytearray(block_size)
+            view = memoryview(buffer)
+            while True:
+                size = file.readinto(buffer)
+                if not size:
+                    break
+                h.update(view[:size])
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source).cast('B')
+        for start in range(0, len(view), block_size):
+            h.update(view[start:start + block_size])
+    else:
+        for chunk in source:
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def hash_many(values: Iterable[Union[str, bytes]],
+              algorithm: str = 'sha256',
+              workers: Optional[int] = None,
+              chunksize: int = 1024) -> List[str]:
+    """
+    Возвращает хеш-суммы множества строк или буферов.
+
+    Значения раздаются пачками пулу потоков: hashlib отпускает GIL
+    при хешировании больших буферов, а на маленьких ключах пачки
+    сокращают накладные расходы на задачи.
+
+    Args:
+        values (Iterable[Union[str, bytes]]): строки (кодируются в UTF-8)
+         или байты.
+        algorithm (str): алгоритм из hashlib.
+        workers (Optional[int]): число потоков. При 1 хеширование
+         идёт в текущем потоке.
+        chunksize (int): размер пачки.
+
+    Returns:
+        List[str]: хеш-суммы в порядке значений.
+    """
+    if not chunksize > 0:
+        raise IntervalError("chunksize должно быть > 0: %d" % chunksize)
+    values = list(values)
+    constructor = _constructor(algorithm)
+
+    def hash_chunk(start: int) -> List[str]:
+        result = []
+        for value in values[start:start + chunksize]:
+            if isinstance(value, str):
+                value = value.encode()
+            result.append(constructor(value).hexdigest())
+        return result
+
+    starts = range(0, len(values), chunksize)
+    if workers == 1 or len(starts) <= 1:
+        chunks = map(hash_chunk, starts)
+    else:
+        with ThreadPoolExecutor(workers) as executor:
+            chunks = list(executor.map(hash_chunk, starts))
+    return [digest for chunk in chunks for digest in chunk]
+
+
+def compare_hashes(hash1: Union[str, bytes],
+                   hash2: Union[str, bytes]) -> bool:
+    """
+    Сравнивает хеш-суммы за постоянное время (hmac.compare_digest),
+    чтобы время сравнения не выдавало совпадающий префикс.
+    Как и ==, возвращает False для значений разных типов (str и bytes)
+    и для значений, не являющихся str или bytes.
+    """
+    if isinstance(hash1, str) and isinstance(hash2, str):
+        return hmac.compare_digest(hash1.encode(), hash2.encode())
+    if isinstance(hash1, bytes) and isinstance(hash2, bytes):
+        return hmac.compare_digest(hash1, hash2)
+    return False
+
+
+def _constructor(algorithm: str):
+    """
+    Возвращает быстрый конструктор hashlib (например, hashlib.sha256),
+    если он есть, иначе hashlib.new.
+    """
+    constructor = getattr(hashlib, algorithm, None)
+    if callable(constructor) and algorithm in hashlib.algorithms_guaranteed:
+        return constructor
+    return lambda data: hashlib.new(algorithm, data)
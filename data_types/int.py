@@ -1,10 +1,20 @@
 from __future__ import annotations
 
 import math
-from typing import Any
+from typing import Any, Dict, Iterable, List, Union
+
+from data_types import bases, primes
+
+# Диапазон целых значений, экземпляры которых кешируются для каждого
+# класса (как малые int в CPython).
+SMALL_MIN, SMALL_MAX = -5, 256
+
+_small_values: Dict[type, tuple] = {}
 
 
 class _FunctionalNumbers:
+    # Без __dict__: малые значения - общие экземпляры (см. _create_class).
+    __slots__ = ()
     __base = 10  # Стандартная система счисления
 
     def __add__(self, other: Any) -> _FunctionalNumbers:
@@ -78,36 +88,83 @@ class _FunctionalNumbers:
         """
         return math.lcm(self, *args)
 
-    def to_base(self, new_base) -> _FunctionalNumbers:
+    def to_base(self, new_base: int) -> Union[_FunctionalNumbers, str]:
         """
-        Преобразует число в систему счисления с основанием new_base.
+        Преобразует число в систему счисления с основанием new_base
+        (от 2 до 62).
+
+        Для оснований до 10 возвращает число того же класса, цифры
+        которого - запись в new_base, например
+        WeakInt(5).to_base(2) -> WeakInt(101). Для больших оснований
+        возвращает строку с цифрами 0-9, A-Z, a-z.
+        Подробнее см. data_types.bases.to_base.
         """
         if new_base == self.__base:
-            return self._create_class(int(str(self)))
-        elif new_base == 10:
-            return self._create_class(int(str(self), new_base))
-        digits = []
-        value = self
-        while value > 0:
-            value, remainder = divmod(value, new_base)
-            digits.append(str(remainder))
-        digits.reverse()
-        return self._create_class(''.join(digits))
+            return self._create_class(int(self))
+        digits = bases.to_base(int(self), new_base)
+        if new_base > 10:
+            return digits
+        return self._create_class(bases.from_base(digits, 10))
+
+    @classmethod
+    def from_base(cls, digits: Union[str, int],
+                  base: int) -> _FunctionalNumbers:
+        """
+        Создаёт число по записи digits в системе счисления base
+        (от 2 до 62), например WeakInt.from_base('FF', 16) -> 255.
+        """
+        return cls(bases.from_base(str(digits), base))
+
+    @classmethod
+    def to_base_many(cls, numbers: Iterable[int],
+                     new_base: int) -> List[Union[_FunctionalNumbers, str]]:
+        """
+        Переводит список чисел в систему счисления new_base, как
+        to_base, вычисляя степени основания один раз.
+        """
+        numbers = [int(number) for number in numbers]
+        results = bases.to_base_many(numbers, new_base)
+        if new_base > 10:
+            return results
+        return [cls(value) for value in bases.from_base_many(results, 10)]
 
     def is_prime(self) -> bool:
         """
         Возвращает True, если число простое, и False в противном случае.
+
+        Работает для чисел любой величины: малые проверяются по
+        кешированному решету, большие - тестом Миллера-Рабина.
+        Подробнее см. data_types.primes.is_prime.
         """
-        if self < 2:
+        if self != int(self):
             return False
-        for i in range(2, int(self.sqrt()) + 1):
-            if self % i == 0:
-                return False
-        return True
+        return primes.is_prime(int(self))
+
+    def factorize(self) -> List[int]:
+        """
+        Возвращает простые множители числа по возрастанию
+        (с повторениями), например WeakInt(12).factorize() -> [2, 2, 3].
+        """
+        return primes.factorize(int(self))
 
-    def _create_class(self, *args, **kwargs) -> _FunctionalNumbers:
-        return self.__class__(*args, **kwargs)
+    def _create_class(self, value: Any) -> _FunctionalNumbers:
+        """
+        Создаёт число того же класса. Целые значения от SMALL_MIN
+        до SMALL_MAX берутся из общего кеша готовых экземпляров,
+        если у экземпляров класса нет __dict__ (иначе атрибут,
+        заданный одному результату, появился бы у всех).
+        """
+        cls = self.__class__
+        if type(value) is int and SMALL_MIN <= value <= SMALL_MAX \
+                and not cls.__dictoffset__:
+            cached = _small_values.get(cls)
+            if cached is None:
+                cached = _small_values[cls] = tuple(
+                    cls(number) for number in range(SMALL_MIN, SMALL_MAX + 1)
+                )
+            return cached[value - SMALL_MIN]
+        return cls(value)
 
 
 class WeakInt(int, _FunctionalNumbers):
-    pass
+    __slots__ = ()
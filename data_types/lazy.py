@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Union
+
+from errors.error import IntervalError
+
+
+class LazyPipeline:
+    """
+    Ленивая цепочка преобразований коллекции.
+
+    Шаги только запоминаются и выполняются за один проход по данным
+    при переборе или вызове завершающей операции (to_list, to_tuple,
+    sum, avg). Промежуточные коллекции не создаются. Каждый шаг
+    возвращает новый конвейер, поэтому его можно переиспользовать.
+
+    Применение:
+        pipeline = SuperiorList(data).lazy().select_type(int)
+        pipeline.filter(lambda x: x > 0).map(abs).limit(10).to_list()
+    """
+
+    def __init__(self, source: Iterable, steps: tuple = ()):
+        self._source = source
+        self._steps = steps
+
+    def filter(self, predicate: Callable) -> LazyPipeline:
+        """
+        Оставляет элементы, для которых predicate вернула истину.
+        """
+        return self._then(filter, predicate)
+
+    def map(self, rule: Callable) -> LazyPipeline:
+        """
+        Применяет rule к каждому элементу.
+        """
+        return self._then(map, rule)
+
+    def select_type(self, type_: Union[Callable, Iterable]) -> LazyPipeline:
+        """
+        Оставляет элементы заданного типа (или типов), как get_by_type.
+        """
+        if type(type_) not in [list, tuple, set]:
+            type_ = (type_,)
+        return self._then(filter, lambda value: type(value) in type_)
+
+    def limit(self, count: int) -> LazyPipeline:
+        """
+        Оставляет первые count элементов. Остальные данные не читаются.
+        """
+        if count < 0:
+            raise IntervalError("count должно быть >= 0: %d" % count)
+        return self._then(_limit, count)
+
+    def chunk(self, size: int) -> LazyPipeline:
+        """
+        Группирует элементы в списки по size штук (последний может
+        быть короче).
+        """
+        if not size > 0:
+            raise IntervalError("size должно быть > 0: %d" % size)
+        return self._then(_chunk, size)
+
+    def __iter__(self) -> Iterator:
+        iterator = iter(self._source)
+        for step, argument in self._steps:
+            iterator = step(argument, iterator)
+        return iterator
+
+    def to_list(self) -> list:
+        return list(self)
+
+    def to_tuple(self) -> tuple:
+        return tuple(self)
+
+    def sum(self) -> Any:
+        return sum(self)
+
+    def avg(self) -> Any:
+        """
+        Возвращает среднее значение, считая сумму и количество
+        за один проход.
+        """
+        total = count = 0
+        for count, value in enumerate(self, 1):
+            total += value
+        return total / count
+
+    def _then(self, step: Callable, argument: Any) -> LazyPipeline:
+        return self.__class__(self._source,
+                              self._steps + ((step, argument),))
+
+
+def _limit(count: int, iterator: Iterator) -> Iterator:
+    return islice(iterator, count)
+
+
+def _chunk(size: int, iterator: Iterator) -> Iterator[list]:
+    return iter(lambda: list(islice(iterator, size)), [])
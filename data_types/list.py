@@ -1,43 +1,92 @@
-from typing import Union, Iterable, Callable, Any
+from concurrent.futures import Executor
+from operator import index as as_index
+from typing import Union, Iterable, Callable, Any, Optional
+from weakref import WeakSet
 
+from data_types.compact import CompactList
+from data_types.cycle import CycleIterator
+from data_types.lazy import LazyPipeline
+from data_types.parallel import map_ordered
+from data_types.ring import RingBuffer
 from errors.error import MaxSizeException
 
+OVERFLOW_POLICIES = ('raise', 'drop_oldest', 'drop_newest')
+
 
 class SuperiorList(list):
+    __max_size = None
+    __overflow = 'raise'
+    __cycles = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.__run = False
         self.__max_size = None
 
-    def cycle(self):
-        number_iter = 0
-        self.__run = True
-        while True:
-            if not self.__run:
-                break
-            yield self[number_iter]
-            number_iter += 1
-            if number_iter >= len(self):
-                number_iter = 0
+    def cycle(self, *others: Iterable) -> CycleIterator:
+        """
+        Возвращает бесконечный итератор по элементам по кругу.
+
+        Если переданы другие коллекции, элементы берутся из всех
+        по очереди. У каждого итератора своя остановка (stop()),
+        stop_cycle() останавливает все итераторы этого объекта.
+        Подробнее см. data_types.cycle.CycleIterator.
+        """
+        iterator = CycleIterator(self, *others)
+        if self.__cycles is None:
+            self.__cycles = WeakSet()
+        self.__cycles.add(iterator)
+        return iterator
 
     def stop_cycle(self):
-        self.__run = False
+        for iterator in list(self.__cycles or ()):
+            iterator.stop()
 
     def get_by_type(self, type_: Union[Callable, Iterable]):
         type_ = self._get_tuple_type(type_)
         return self.__class__([i for i in self if type(i) in type_])
 
-    def apply_rule(self, rule: Callable):
-        for i in range(len(self)):
-            self[i] = rule(self[i])
+    def apply_rule(self, rule: Callable,
+                   executor: Union[str, Executor, None] = None,
+                   chunksize: Optional[int] = None,
+                   workers: Optional[int] = None):
+        """
+        Применяет rule к каждому элементу списка.
+
+        Если задан executor ('thread', 'process', 'asyncio' или
+        concurrent.futures.Executor), элементы обрабатываются пачками
+        параллельно, а список меняется только если rule отработала
+        без ошибок. Иначе ошибки собираются в RuleApplicationError.
+        Подробнее см. data_types.parallel.map_ordered.
+        """
+        if executor is None:
+            for i, value in enumerate(list.__iter__(self)):
+                list.__setitem__(self, i, rule(value))
+            return self
+        self[:] = map_ordered(rule, self, executor, chunksize, workers)
         return self
 
     def apply_rule_by_type(self, type_: Union[Callable, Iterable],
-                           rule: Callable):
+                           rule: Callable,
+                           executor: Union[str, Executor, None] = None,
+                           chunksize: Optional[int] = None,
+                           workers: Optional[int] = None):
+        """
+        Применяет rule к элементам заданного типа (или типов).
+
+        Параметры executor, chunksize и workers - как у apply_rule.
+        """
         type_ = self._get_tuple_type(type_)
-        for i in range(len(self)):
-            if type(self[i]) in type_:
-                self[i] = rule(self[i])
+        if executor is None:
+            for i, value in enumerate(list.__iter__(self)):
+                if type(value) in type_:
+                    list.__setitem__(self, i, rule(value))
+            return self
+        positions = [i for i, value in enumerate(self)
+                     if type(value) in type_]
+        results = map_ordered(rule, [self[i] for i in positions],
+                              executor, chunksize, workers)
+        for i, value in zip(positions, results):
+            self[i] = value
         return self
 
     def _get_tuple_type(self, type_):
@@ -47,11 +96,70 @@ class SuperiorList(list):
 
     def remove_by_type(self, type_: Union[Callable, Iterable]):
         type_ = self._get_tuple_type(type_)
-        for i in range(len(self)):
-            if type(self[i]) in type_:
-                self.pop(i)
+        self._compact(lambda value: type(value) not in type_)
         return self
 
+    def remove_where(self, predicate: Callable) -> int:
+        """
+        Удаляет элементы, для которых predicate вернула истину,
+        за один проход без лишних сдвигов.
+
+        Returns:
+            int: число удалённых элементов.
+        """
+        return self._compact(lambda value: not predicate(value))
+
+    def partition(self, predicate: Callable) -> int:
+        """
+        Переставляет элементы на месте: сначала те, для которых
+        predicate вернула истину, затем остальные. Порядок внутри
+        каждой группы сохраняется.
+
+        Returns:
+            int: число элементов первой группы (индекс границы).
+        """
+        rest = []
+        try:
+            split = len(self) - self._compact(predicate, rest)
+        finally:
+            # Даже при ошибке в predicate ни один элемент не теряется.
+            list.extend(self, rest)
+        return split
+
+    def _compact(self, keep: Callable, removed: Optional[list] = None) -> int:
+        """
+        Сдвигает подходящие под keep элементы к началу списка двумя
+        указателями (чтение и запись) и отрезает хвост одним
+        удалением, поэтому работает за O(n) вместо O(n^2)
+        у поочерёдных удалений.
+
+        Если keep бросает исключение, уже просмотренные элементы
+        остаются отфильтрованными, а непрочитанный хвост (вместе
+        с элементом, на котором произошла ошибка) сдвигается к ним,
+        так что список остаётся целым.
+
+        Args:
+            keep (Callable): функция, решающая, оставить ли элемент.
+            removed (Optional[list]): список, куда складываются
+             удалённые элементы.
+
+        Returns:
+            int: число удалённых элементов.
+        """
+        setitem = list.__setitem__
+        write = read = 0
+        try:
+            for value in list.__iter__(self):
+                if keep(value):
+                    setitem(self, write, value)
+                    write += 1
+                elif removed is not None:
+                    removed.append(value)
+                read += 1
+        finally:
+            list.__delitem__(self, slice(write, read))
+        return read - write
+
     def get_by_list(self):
         return list(self)
 
@@ -79,32 +187,164 @@ class SuperiorList(list):
     def len(self):
         return len(self)
 
+    def lazy(self) -> LazyPipeline:
+        """
+        Возвращает ленивый конвейер над элементами: filter, map,
+        select_type, limit и chunk выполняются за один проход без
+        промежуточных коллекций. Подробнее см.
+        data_types.lazy.LazyPipeline.
+        """
+        return LazyPipeline(self)
+
+    def compact(self) -> CompactList:
+        """
+        Возвращает копию списка в компактном хранилище.
+
+        Если все элементы int или все float, они хранятся в
+        array.array, а sum, avg, max и min считаются векторно.
+        Подробнее см. data_types.compact.CompactList.
+        """
+        return CompactList(self)
+
     def filter(self, filter_func: Callable):
-        for i in range(len(self)):
-            if not filter_func(self[i]):
-                del self[i]
+        self._compact(filter_func)
         return self
 
-    def limit(self, max_size: int):
+    def limit(self, max_size: int, overflow: str = 'raise'):
+        """
+        Ограничивает длину списка.
+
+        Ограничение действует на append, extend, insert, +, +=, *=
+        и запись срезом, меняющую длину. Список всегда хранится
+        по порядку. Вытеснение самого старого элемента при
+        overflow='drop_oldest' сдвигает остальные (как del [0]),
+        для O(1) есть ring().
+
+        При вытеснении (insert, запись срезом) удаляются самые старые
+        из прежних элементов, новые значения остаются.
+
+        Args:
+            max_size (int): максимальная длина.
+            overflow (str): что делать при переполнении:
+             'raise' - выбросить MaxSizeException;
+             'drop_oldest' - вытеснить самые старые элементы;
+             'drop_newest' - отбросить новые элементы.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                "overflow должен быть одним из {names}: {overflow!r}".format(
+                    names=OVERFLOW_POLICIES, overflow=overflow)
+            )
+        if not max_size > 0:
+            raise MaxSizeException(
+                "Максимальная длина должна быть > 0: %d" % max_size)
         self.__max_size = max_size
-        if max_size > len(self):
-            return self
-        for i in range(len(self) - max_size):
-            del self[-1]
+        self.__overflow = overflow
+        excess = len(self) - max_size
+        if excess > 0:
+            if overflow == 'drop_oldest':
+                list.__delitem__(self, slice(None, excess))
+            else:
+                list.__delitem__(self, slice(max_size, None))
         return self
 
     def stop_limit(self):
         self.__max_size = None
+        self.__overflow = 'raise'
         return self
 
+    def ring(self, max_size: int) -> RingBuffer:
+        """
+        Возвращает последние max_size элементов в кольцевом буфере:
+        append в заполненный буфер вытесняет самый старый элемент
+        за O(1). Подробнее см. data_types.ring.RingBuffer.
+        """
+        return RingBuffer(self, max_size)
+
     def append(self, *args, **kwargs):
         if self.__max_size and (self.__max_size < len(self) + 1):
-            raise MaxSizeException("Превышена максимальная длина списка")
+            if self.__overflow == 'drop_newest':
+                return
+            if self.__overflow == 'raise':
+                raise MaxSizeException("Превышена максимальная длина списка")
+            list.__delitem__(self, 0)
         super().append(*args, **kwargs)
 
+    def extend(self, values: Iterable):
+        if not self.__max_size:
+            return super().extend(values)
+        values = list(values)
+        free = self.__max_size - len(self)
+        if len(values) <= free:
+            return list.extend(self, values)
+        if self.__overflow == 'raise':
+            raise MaxSizeException("Превышена максимальная длина списка")
+        if self.__overflow == 'drop_newest':
+            return list.extend(self, values[:max(free, 0)])
+        list.__delitem__(self, slice(None, len(values) - free))
+        list.extend(self, values[-self.__max_size:])
+
+    def insert(self, index: int, value: Any):
+        if self.__max_size and (self.__max_size < len(self) + 1):
+            if self.__overflow == 'drop_newest':
+                return
+            if self.__overflow == 'raise':
+                raise MaxSizeException("Превышена максимальная длина списка")
+            # Вытесняется самый старый из прежних элементов,
+            # а не только что вставленный.
+            index = as_index(index)
+            if index < 0:
+                index += len(self)
+            index = min(max(index, 0), len(self))
+            list.__delitem__(self, 0)
+            list.insert(self, max(index - 1, 0), value)
+            return
+        list.insert(self, index, value)
+
+    def __setitem__(self, index: Union[int, slice], value: Any):
+        # Запись по индексу длину не меняет и проверок не требует.
+        if not self.__max_size or not isinstance(index, slice):
+            return list.__setitem__(self, index, value)
+        size = len(self)
+        start, stop, step = index.indices(size)
+        if step != 1:
+            # Расширенный срез не меняет длину.
+            return list.__setitem__(self, index, value)
+        stop = max(stop, start)
+        values = list(value)
+        excess = size - (stop - start) + len(values) - self.__max_size
+        if excess > 0:
+            if self.__overflow == 'raise':
+                raise MaxSizeException("Превышена максимальная длина списка")
+            if self.__overflow == 'drop_newest':
+                values = values[:len(values) - excess]
+            else:
+                front = min(excess, start)
+                back = min(excess - front, size - stop)
+                values = values[excess - front - back:]
+                list.__delitem__(self, slice(stop, stop + back))
+                list.__delitem__(self, slice(None, front))
+                start -= front
+                stop -= front
+        list.__setitem__(self, slice(start, stop), values)
+
+    def __imul__(self, count: int):
+        if not self.__max_size:
+            return list.__imul__(self, count)
+        # Копии добавляются через extend и подчиняются overflow.
+        count = as_index(count)
+        if count <= 0:
+            self.clear()
+        elif count > 1:
+            self.extend(list.__getitem__(self, slice(None)) * (count - 1))
+        return self
+
+    def __iadd__(self, other: Iterable):
+        self.extend(other)
+        return self
+
     def remove_all(self, other: Any):
-        for i in range(self.count(other)):
-            self.remove(other)
+        self._compact(lambda value: not (value is other or value == other))
         return self
 
     def __add__(self, other: Any):
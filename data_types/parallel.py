@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import math
+import os
+from concurrent.futures import (Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+from typing import Any, Callable, Iterable, List, Optional, Union
+
+from errors.error import IntervalError, RuleApplicationError
+
+EXECUTORS = ('thread', 'process', 'asyncio')
+
+
+def map_ordered(rule: Callable, values: Iterable,
+                executor: Union[str, Executor, None] = None,
+                chunksize: Optional[int] = None,
+                workers: Optional[int] = None) -> List[Any]:
+    """
+    Применяет rule ко всем значениям и возвращает результаты
+    в исходном порядке.
+
+    Значения делятся на пачки по chunksize штук. Ошибки не прерывают
+    обработку остальных значений: после завершения всех пачек они
+    собираются в одно исключение RuleApplicationError.
+
+    Args:
+        rule (Callable): функция для применения. Для 'asyncio' может
+         быть корутинной функцией, для 'process' должна сериализоваться
+         pickle.
+        values (Iterable): значения.
+        executor (Union[str, Executor, None]): 'thread', 'process',
+         'asyncio', готовый concurrent.futures.Executor или None
+         (последовательно в текущем потоке).
+        chunksize (Optional[int]): размер пачки, по умолчанию значения
+         делятся примерно на 4 пачки на исполнителя. Для 'asyncio'
+         не используется: вызовы идут непрерывно, до workers
+         одновременно.
+        workers (Optional[int]): число потоков, процессов или
+         одновременно выполняемых корутин. По умолчанию os.cpu_count()
+         для процессов и min(32, os.cpu_count() + 4) для остальных.
+
+    Returns:
+        List[Any]: результаты в порядке значений.
+
+    Raises:
+        RuleApplicationError: если rule упала хотя бы на одном значении,
+         errors содержит пары (позиция, исключение).
+        RuntimeError: для 'asyncio' при вызове из работающего цикла
+         событий (map_ordered блокирует поток и запускает свой цикл
+         через asyncio.run).
+    """
+    values = list(values)
+    if executor is not None and executor not in EXECUTORS and not \
+            isinstance(executor, Executor):
+        raise ValueError(
+            "executor должен быть одним из {names} или Executor: "
+            "{executor!r}".format(names=EXECUTORS, executor=executor)
+        )
+    if executor == 'asyncio' and _in_event_loop():
+        raise RuntimeError(
+            "executor='asyncio' нельзя использовать внутри работающего "
+            "цикла событий: вызовите map_ordered из потока, например "
+            "через asyncio.to_thread"
+        )
+    if not workers:
+        cpus = os.cpu_count() or 1
+        workers = cpus if executor == 'process' else min(32, cpus + 4)
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(values) / (workers * 4)))
+    if not chunksize > 0:
+        raise IntervalError("chunksize должно быть > 0: %d" % chunksize)
+    chunks = [values[i:i + chunksize]
+              for i in range(0, len(values), chunksize)]
+
+    if executor is None:
+        outcomes = [_apply_chunk(rule, chunk) for chunk in chunks]
+    elif executor == 'asyncio':
+        outcomes = [asyncio.run(_apply_async(rule, values, workers))]
+    elif isinstance(executor, Executor):
+        outcomes = list(executor.map(_apply_chunk, [rule] * len(chunks),
+                                     chunks))
+    else:
+        pool = ThreadPoolExecutor if executor == 'thread' else \
+            ProcessPoolExecutor
+        with pool(workers) as running:
+            outcomes = list(running.map(_apply_chunk, [rule] * len(chunks),
+                                        chunks))
+
+    results, errors = [], []
+    for chunk in outcomes:
+        for failed, value in chunk:
+            if failed:
+                errors.append((len(results), value))
+            results.append(value)
+    if errors:
+        raise RuleApplicationError(errors)
+    return results
+
+
+def _apply_chunk(rule: Callable, chunk: list) -> list:
+    """
+    Применяет rule к пачке, возвращая пары (ошибка ли, результат).
+    """
+    outcome = []
+    for value in chunk:
+        try:
+            outcome.append((False, rule(value)))
+        except Exception as error:
+            outcome.append((True, error))
+    return outcome
+
+
+async def _apply_async(rule: Callable, values: list,
+                       workers: int) -> list:
+    """
+    Выполняет вызовы в цикле событий: workers сопрограмм берут
+    значения из общего итератора, поэтому одновременно идёт до workers
+    вызовов без барьеров между пачками. Обычные функции уходят
+    в поток через to_thread. Возвращает пары (ошибка ли, результат).
+    """
+    is_coroutine = inspect.iscoroutinefunction(rule)
+    if not is_coroutine:
+        # Пул по умолчанию ограничен min(32, cpu + 4) потоками.
+        # asyncio.run закроет его вместе с циклом.
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(workers))
+    outcome = [None] * len(values)
+    pending = iter(enumerate(values))
+
+    async def worker():
+        for position, value in pending:
+            try:
+                if is_coroutine:
+                    result = await rule(value)
+                else:
+                    result = await asyncio.to_thread(rule, value)
+                outcome[position] = (False, result)
+            except Exception as error:
+                outcome[position] = (True, error)
+
+    await asyncio.gather(*(worker() for _ in
+                           range(min(workers, len(values)))))
+    return outcome
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
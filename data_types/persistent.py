@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, Iterable, Iterator, Union
+
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+
+
+class PersistentVector(Sequence):
+    """
+    Неизменяемая последовательность с общей структурой между версиями.
+
+    Элементы лежат в листьях 32-арного префиксного дерева, последние
+    (до 32) - в отдельном хвосте. append, set и pop возвращают новую
+    версию, копируя только путь от корня до листа: O(log32 n) вместо
+    копирования всего кортежа. Старая версия остаётся нетронутой,
+    а неизменённые узлы используются обеими версиями.
+
+    Как и кортеж, вектор хешируется и равен кортежу с теми же
+    элементами.
+
+    Применение:
+        v1 = PersistentVector(range(1000))
+        v2 = v1.set(10, 'x').append('y')
+        v1[10], v2[10]  # (10, 'x')
+    """
+
+    __slots__ = ('_count', '_shift', '_root', '_tail', '_hash')
+
+    def __init__(self, values: Iterable = ()):
+        values = tuple(values)
+        count = len(values)
+        tail_start = (count - 1) >> BITS << BITS if count else 0
+        nodes = [values[i:i + WIDTH] for i in range(0, tail_start, WIDTH)]
+        shift = BITS
+        while len(nodes) > WIDTH:
+            nodes = [tuple(nodes[i:i + WIDTH])
+                     for i in range(0, len(nodes), WIDTH)]
+            shift += BITS
+        self._init(count, shift, tuple(nodes), values[tail_start:])
+
+    def _init(self, count: int, shift: int, root: tuple,
+              tail: tuple) -> None:
+        set_slot = object.__setattr__
+        set_slot(self, '_count', count)
+        set_slot(self, '_shift', shift)
+        set_slot(self, '_root', root)
+        set_slot(self, '_tail', tail)
+        set_slot(self, '_hash', None)
+
+    @classmethod
+    def _make(cls, count: int, shift: int, root: tuple,
+              tail: tuple) -> PersistentVector:
+        vector = cls.__new__(cls)
+        vector._init(count, shift, root, tail)
+        return vector
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("PersistentVector неизменяем")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("PersistentVector неизменяем")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return self.__class__(self[i] for i in
+                                  range(*index.indices(self._count)))
+        index = self._check_index(index)
+        return self._leaf_for(index)[index & MASK]
+
+    def __iter__(self) -> Iterator:
+        for start in range(0, self._tail_offset(), WIDTH):
+            yield from self._leaf_for(start)
+        yield from self._tail
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, PersistentVector):
+            return self._count == other._count and all(
+                a == b for a, b in zip(self, other))
+        if isinstance(other, tuple):
+            return self._count == len(other) and all(
+                a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash(tuple(self)))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return '{name}({values!r})'.format(name=self.__class__.__name__,
+                                           values=list(self))
+
+    def __reduce__(self):
+        return self.__class__, (tuple(self),)
+
+    def append(self, value: Any) -> PersistentVector:
+        """
+        Возвращает новую версию с value в конце.
+        """
+        count, shift, root, tail = self._count, self._shift, \
+            self._root, self._tail
+        if len(tail) < WIDTH:
+            return self._make(count + 1, shift, root, tail + (value,))
+        if count >> BITS > 1 << shift:
+            root = (root, self._new_path(shift, tail))
+            shift += BITS
+        else:
+            root = self._push_tail(shift, root, tail)
+        return self._make(count + 1, shift, root, (value,))
+
+    def extend(self, values: Iterable) -> PersistentVector:
+        """
+        Возвращает новую версию с values в конце.
+        """
+        vector = self
+        for value in values:
+            vector = vector.append(value)
+        return vector
+
+    def set(self, index: int, value: Any) -> PersistentVector:
+        """
+        Возвращает новую версию, где элемент index заменён на value.
+        """
+        index = self._check_index(index)
+        if index >= self._tail_offset():
+            position = index & MASK
+            tail = self._tail[:position] + (value,) + \
+                self._tail[position + 1:]
+            return self._make(self._count, self._shift, self._root, tail)
+        root = self._assoc(self._shift, self._root, index, value)
+        return self._make(self._count, self._shift, root, self._tail)
+
+    def pop(self, index: int = -1) -> PersistentVector:
+        """
+        Возвращает новую версию без элемента index.
+
+        Удаление последнего элемента стоит O(log32 n), удаление
+        из середины перестраивает вектор за O(n).
+        """
+        index = self._check_index(index)
+        if index != self._count - 1:
+            values = list(self)
+            del values[index]
+            return self.__class__(values)
+        if self._count == 1:
+            return self.__class__()
+        if len(self._tail) > 1:
+            return self._make(self._count - 1, self._shift, self._root,
+                              self._tail[:-1])
+        tail = self._leaf_for(self._count - 2)
+        root = self._pop_tail(self._shift, self._root) or ()
+        shift = self._shift
+        if shift > BITS and len(root) == 1:
+            root = root[0]
+            shift -= BITS
+        return self._make(self._count - 1, shift, root, tail)
+
+    def to_tuple(self) -> tuple:
+        return tuple(self)
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Индекс вне диапазона")
+        return index
+
+    def _tail_offset(self) -> int:
+        return self._count - len(self._tail)
+
+    def _leaf_for(self, index: int) -> tuple:
+        if index >= self._tail_offset():
+            return self._tail
+        node = self._root
+        for level in range(self._shift, 0, -BITS):
+            node = node[(index >> level) & MASK]
+        return node
+
+    def _push_tail(self, level: int, parent: tuple, leaf: tuple) -> tuple:
+        position = ((self._count - 1) >> level) & MASK
+        if level == BITS:
+            child = leaf
+        elif position < len(parent):
+            child = self._push_tail(level - BITS, parent[position], leaf)
+        else:
+            child = self._new_path(level - BITS, leaf)
+        return parent[:position] + (child,) + parent[position + 1:]
+
+    def _pop_tail(self, level: int, node: tuple):
+        position = ((self._count - 2) >> level) & MASK
+        if level > BITS:
+            child = self._pop_tail(level - BITS, node[position])
+            if child is None:
+                return node[:position] or None
+            return node[:position] + (child,)
+        return node[:position] or None
+
+    def _assoc(self, level: int, node: tuple, index: int,
+               value: Any) -> tuple:
+        position = (index >> level) & MASK
+        if level:
+            value = self._assoc(level - BITS, node[position], index, value)
+        return node[:position] + (value,) + node[position + 1:]
+
+    @staticmethod
+    def _new_path(level: int, node: tuple) -> tuple:
+        while level:
+            node = (node,)
+            level -= BITS
+        return node
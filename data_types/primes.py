@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import threading
+from itertools import compress
+from math import gcd, isqrt
+from typing import Iterable, List
+
+from errors.error import IntervalError
+
+# Решето кешируется до этой границы (1 байт на число).
+SIEVE_LIMIT = 1 << 22
+SEGMENT_SIZE = 1 << 18
+
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47,
+                53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+# Основания Миллера-Рабина: проверка по ним детерминирована для
+# всех n < MILLER_RABIN_LIMIT.
+MILLER_RABIN_BASES = SMALL_PRIMES[:13]
+MILLER_RABIN_LIMIT = 3317044064679887385961981
+
+_sieve = bytearray(b'\x00\x00\x01\x01')
+_lock = threading.Lock()
+
+
+def is_prime(n: int) -> bool:
+    """
+    Проверяет число на простоту.
+
+    Числа меньше SIEVE_LIMIT проверяются по кешированному решету,
+    которое при необходимости расширяется. Остальные - пробным
+    делением на малые простые и тестом Миллера-Рабина,
+    детерминированным для n < MILLER_RABIN_LIMIT. Для больших чисел
+    к нему добавляется сильный тест Люка (тест Baillie-PSW, для
+    которого контрпримеры неизвестны).
+
+    Args:
+        n (int): число любой величины.
+
+    Returns:
+        bool: True, если число простое.
+    """
+    if n < 2:
+        return False
+    if n < SIEVE_LIMIT:
+        _extend_sieve(n + 1)
+        return bool(_sieve[n])
+    for prime in SMALL_PRIMES:
+        if n % prime == 0:
+            return n == prime
+    if n < SMALL_PRIMES[-1] ** 2:
+        return True
+    if not _miller_rabin(n, MILLER_RABIN_BASES):
+        return False
+    return n < MILLER_RABIN_LIMIT or _strong_lucas(n)
+
+
+def is_prime_many(values: Iterable[int]) -> List[bool]:
+    """
+    Проверяет на простоту множество чисел.
+
+    Решето один раз расширяется до наибольшего из значений меньше
+    SIEVE_LIMIT, после чего такие значения проверяются по таблице.
+
+    Args:
+        values (Iterable[int]): числа.
+
+    Returns:
+        List[bool]: результаты в порядке значений.
+    """
+    values = list(values)
+    small = [value for value in values if value < SIEVE_LIMIT]
+    if small:
+        _extend_sieve(max(small) + 1)
+    sieve = _sieve
+    size = len(sieve)
+    return [bool(sieve[value]) if 0 <= value < size else is_prime(value)
+            for value in values]
+
+
+def primes_in_range(start: int, stop: int) -> List[int]:
+    """
+    Возвращает простые числа из полуинтервала [start, stop).
+
+    До SIEVE_LIMIT используется кешированное решето, выше -
+    сегментированное решето: отрезки по SEGMENT_SIZE чисел
+    вычёркиваются простыми до sqrt(stop).
+
+    Args:
+        start (int): начало диапазона.
+        stop (int): конец диапазона (не включается).
+
+    Returns:
+        List[int]: простые числа по возрастанию.
+    """
+    start = max(start, 2)
+    if stop <= start:
+        return []
+    if stop <= SIEVE_LIMIT:
+        _extend_sieve(stop)
+        return list(compress(range(start, stop), _sieve[start:stop]))
+
+    primes = primes_in_range(start, SIEVE_LIMIT)
+    start = max(start, SIEVE_LIMIT)
+    base = primes_in_range(2, isqrt(stop - 1) + 1)
+    for low in range(start, stop, SEGMENT_SIZE):
+        high = min(low + SEGMENT_SIZE, stop)
+        primes.extend(compress(range(low, high),
+                               _sieve_segment(low, high, base)))
+    return primes
+
+
+def factorize(n: int) -> List[int]:
+    """
+    Раскладывает число на простые множители.
+
+    Малые множители снимаются пробным делением, остаток делится
+    ро-методом Полларда (вариант Брента) до простых частей.
+
+    Args:
+        n (int): число >= 1.
+
+    Returns:
+        List[int]: простые множители по возрастанию с повторениями.
+    """
+    if n < 1:
+        raise IntervalError("n должно быть >= 1: %d" % n)
+    factors = []
+    for prime in SMALL_PRIMES:
+        while n % prime == 0:
+            factors.append(prime)
+            n //= prime
+    pending = [n] if n > 1 else []
+    while pending:
+        value = pending.pop()
+        if is_prime(value):
+            factors.append(value)
+            continue
+        root = isqrt(value)
+        if root * root == value:
+            pending += [root, root]
+            continue
+        divisor = _pollard_rho(value)
+        pending += [divisor, value // divisor]
+    factors.sort()
+    return factors
+
+
+def _extend_sieve(stop: int) -> None:
+    """
+    Расширяет кешированное решето так, чтобы оно покрывало [0, stop).
+    Новые части вычисляются сегментами, известное не пересчитывается.
+    """
+    global _sieve
+    stop = min(stop, SIEVE_LIMIT)
+    if stop <= len(_sieve):
+        return
+    with _lock:
+        while len(_sieve) < stop:
+            size = len(_sieve)
+            # Простые до корня из new_size должны быть уже известны.
+            new_size = min(max(stop, size * 2), SIEVE_LIMIT, size * size)
+            base = list(compress(range(size), _sieve))
+            _sieve = _sieve + _sieve_segment(size, new_size, base)
+
+
+def _sieve_segment(start: int, stop: int, base: List[int]) -> bytearray:
+    """
+    Возвращает флаги простоты чисел [start, stop). base должна
+    содержать все простые до sqrt(stop - 1).
+    """
+    segment = bytearray(b'\x01') * (stop - start)
+    limit = isqrt(stop - 1)
+    for prime in base:
+        if prime > limit:
+            break
+        first = max(prime * prime, (start + prime - 1) // prime * prime)
+        if first < stop:
+            count = (stop - 1 - first) // prime + 1
+            segment[first - start::prime] = bytes(count)
+    for value in range(start, min(2, stop)):
+        segment[value - start] = 0
+    return segment
+
+
+def _miller_rabin(n: int, bases: Iterable[int]) -> bool:
+    d, s = n - 1, 0
+    while not d & 1:
+        d >>= 1
+        s += 1
+    for base in bases:
+        x = pow(base, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _strong_lucas(n: int) -> bool:
+    """
+    Сильный тест Люка с параметрами Селфриджа (n нечётное,
+    не квадрат и без малых делителей).
+    """
+    root = isqrt(n)
+    if root * root == n:
+        return False
+    d = 5
+    while _jacobi(d, n) != -1:
+        d = -d - 2 if d > 0 else -d + 2
+    p, q = 1, (1 - d) // 4
+
+    k, s = n + 1, 0
+    while not k & 1:
+        k >>= 1
+        s += 1
+    u, v, q_k = 1, p, q % n
+    for bit in bin(k)[3:]:
+        u, v = u * v % n, (v * v - 2 * q_k) % n
+        q_k = q_k * q_k % n
+        if bit == '1':
+            u, v = p * u + v, d * u + p * v
+            u = (u + n if u & 1 else u) // 2 % n
+            v = (v + n if v & 1 else v) // 2 % n
+            q_k = q_k * q % n
+    if u == 0 or v == 0:
+        return True
+    for _ in range(s - 1):
+        v = (v * v - 2 * q_k) % n
+        if v == 0:
+            return True
+        q_k = q_k * q_k % n
+    return False
+
+
+def _jacobi(a: int, n: int) -> int:
+    a %= n
+    result = 1
+    while a:
+        while not a & 1:
+            a >>= 1
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _pollard_rho(n: int) -> int:
+    """
+    Возвращает нетривиальный делитель составного n (ро-метод
+    Полларда, вариант Брента с накоплением произведения для gcd).
+    """
+    if not n & 1:
+        return 2
+    step = 128
+    for c in range(1, n):
+        y, r, q, g = 2, 1, 1, 1
+        x = ys = y
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(step, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += step
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = gcd(abs(x - ys), n)
+        if g != n:
+            return g
+    raise ValueError("Не удалось найти делитель: %d" % n)
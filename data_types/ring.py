@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import MutableSequence
+from typing import Any, Iterable, Optional, Union
+
+
+class RingBuffer(MutableSequence):
+    """
+    Кольцевой буфер фиксированной длины для последних значений.
+
+    Элементы лежат в collections.deque с maxlen: когда буфер
+    заполнен, append вытесняет самый старый элемент за O(1), без
+    сдвига остальных, как у list при del [0]. Доступ по индексу
+    у концов тоже O(1), в середине - O(n).
+
+    snapshot() возвращает элементы списком, от старых к новым.
+
+    Применение:
+        recent = RingBuffer(maxlen=3)
+        recent.extend([1, 2, 3, 4])
+        recent.snapshot()  # [2, 3, 4]
+    """
+
+    def __init__(self, values: Iterable = (), maxlen: Optional[int] = None):
+        if maxlen is None or not maxlen > 0:
+            raise ValueError(
+                "Длина буфера должна быть > 0: {maxlen!r}".format(
+                    maxlen=maxlen))
+        self._data = deque(values, maxlen)
+
+    @property
+    def maxlen(self) -> int:
+        return self._data.maxlen
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __reversed__(self):
+        return reversed(self._data)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._data
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return self.snapshot()[index]
+        return self._data[index]
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        self._data[index] = value
+
+    def __delitem__(self, index: int) -> None:
+        del self._data[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RingBuffer):
+            other = other._data
+        elif not isinstance(other, (list, tuple, deque)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self._data, other))
+
+    def __repr__(self) -> str:
+        return '{name}({values!r}, maxlen={maxlen})'.format(
+            name=self.__class__.__name__, values=list(self._data),
+            maxlen=self.maxlen)
+
+    def __reduce__(self):
+        return self.__class__, (list(self._data), self.maxlen)
+
+    def insert(self, index: int, value: Any) -> None:
+        """
+        Вставляет значение по индексу. В заполненный буфер вставка
+        невозможна (IndexError, как у deque).
+        """
+        self._data.insert(index, value)
+
+    def append(self, value: Any) -> None:
+        self._data.append(value)
+
+    def extend(self, values: Iterable) -> None:
+        self._data.extend(values)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def snapshot(self) -> list:
+        """
+        Возвращает копию элементов списком, от старых к новым.
+        """
+        return list(self._data)
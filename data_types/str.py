@@ -2,11 +2,31 @@ from __future__ import annotations
 
 import hashlib
 import re
-from typing import Callable, List, Optional
-
+from typing import Callable, Iterable, Iterator, List, Optional, Union
+
+from data_types.distance import (FuzzyIndex, get_close_matches_many,
+                                 levenshtein)
+from data_types.hashing import (DEFAULT_BLOCK_SIZE, compare_hashes,
+                                hash_stream)
+from data_types.patterns import (CREDIT_CARD_PATTERN, EMAIL_PATTERN,
+                                 NUMBER_PATTERN, pattern_cache)
+from data_types.substring import (longest_common_substring,
+                                  longest_common_substring_many)
 from errors.error import IntervalError
 
 
+def _to_lookup(exclude):
+    """
+    Превращает exclude в множество для проверки вхождения за O(1).
+    Строка остаётся строкой, чтобы сохранить проверку по подстроке.
+    """
+    if exclude is None:
+        return frozenset()
+    if isinstance(exclude, (str, set, frozenset)):
+        return exclude
+    return set(exclude)
+
+
 class WeakStr(str):
     def __add__(self, other):
         if type(other) in (list, tuple, set,):
@@ -30,9 +50,10 @@ class WeakStr(str):
 
     def find_substring(self, substring: str):
         """
-        Находит все вхождения подстроки в строке.
+        Находит первое вхождение регулярного выражения в строке.
 
-        Используется re.search.
+        Используется re.search, скомпилированные выражения
+        берутся из pattern_cache.
 
         Args:
             substring (str): строка, которую будем искать.
@@ -40,10 +61,25 @@ class WeakStr(str):
         Returns:
             Результат вызова re.search
         """
-        return re.search(substring, self)
+        return pattern_cache.get(substring).search(self)
 
-    def get_close_matches(self, possibilities: List[str], n: int = 3,
-                          cutoff: float = 0.6) -> List[str]:
+    def find_all(self, substring: str) -> Iterator[re.Match]:
+        """
+        Лениво перебирает все вхождения регулярного выражения в строке.
+
+        Args:
+            substring (str): строка, которую будем искать.
+
+        Returns:
+            Iterator[re.Match]: результат вызова re.finditer.
+        """
+        return pattern_cache.get(substring).finditer(self)
+
+    def get_close_matches(self,
+                          possibilities: Union[List[str], FuzzyIndex],
+                          n: int = 3,
+                          cutoff: float = 0.6,
+                          bit_parallel: bool = False) -> List[str]:
         """
         Находит ближайшие совпадения для слова в списке возможностей с
         использованием расстояния Левенштейна.
@@ -51,8 +87,9 @@ class WeakStr(str):
         В качестве слова, использует значение текущей строки (self).
 
         Args:
-            possibilities (List[str]): Список строк, в котором нужно искать
-             близкие совпадения.
+            possibilities (Union[List[str], FuzzyIndex]): Список строк
+             или заранее построенный индекс FuzzyIndex, в котором нужно
+             искать близкие совпадения.
             n (int): Максимальное число близких совпадений,
              которые нужно вернуть.
             cutoff (float): Число с плавающей точкой в диапазоне [0.0, 1.0],
@@ -60,6 +97,8 @@ class WeakStr(str):
              между 'word' и близким совпадением.
              Совпадения с расстоянием большим, чем 'cutoff',
              не будут возвращены.
+            bit_parallel (bool): использовать битово-параллельный
+             алгоритм для коротких строк.
 
         Returns:
             List[str]: Список ближайших совпадений, отсортированный
@@ -71,29 +110,61 @@ class WeakStr(str):
         if not 0.0 <= cutoff <= 1.0:
             raise IntervalError("cutoff в промежутке [0.0, 1.0]: %r" % cutoff)
 
-        result = []
         max_distance = len(self) * cutoff
+        if isinstance(possibilities, FuzzyIndex):
+            return possibilities.close_matches(self, n, cutoff)
+
+        result = []
         for possibility in possibilities:
-            distance = self._calculate_distance(self, possibility)
+            distance = self._calculate_distance(
+                self, possibility, max_distance, bit_parallel
+            )
             if distance <= max_distance:
                 result.append((distance, possibility))
         result.sort()
         return [x[1] for x in result][:n]
 
-    def _calculate_distance(self, a: str, b: str) -> int:
+    @classmethod
+    def get_close_matches_many(cls, queries: List[str],
+                               possibilities: Union[List[str], FuzzyIndex],
+                               n: int = 3, cutoff: float = 0.6,
+                               processes: Optional[int] = None,
+                               chunksize: Optional[int] = None
+                               ) -> List[List[str]]:
+        """
+        Находит ближайшие совпадения сразу для множества строк.
+
+        Результат для каждой строки совпадает с результатом
+        get_close_matches, но вычисления распределяются по процессам.
+        Подробнее см. data_types.distance.get_close_matches_many.
+
+        Args:
+            queries (List[str]): строки, для которых ищутся совпадения.
+            possibilities (Union[List[str], FuzzyIndex]): общий список
+             строк или индекс.
+            n (int): максимальное число совпадений на строку.
+            cutoff (float): см. get_close_matches.
+            processes (Optional[int]): число процессов.
+            chunksize (Optional[int]): размер пачки запросов.
+
+        Returns:
+            List[List[str]]: результаты в порядке запросов.
+        """
+        return get_close_matches_many(queries, possibilities, n, cutoff,
+                                      processes, chunksize)
+
+    def _calculate_distance(self, a: str, b: str,
+                            max_distance: Optional[float] = None,
+                            bit_parallel: bool = False) -> int:
         """
         Вычислить расстояние Левенштейна между a и b.
+
+        Если задан max_distance, вычисление прекращается, как только
+        расстояние гарантированно его превысит.
         """
-        if not a:
-            return len(b)
-        if not b:
-            return len(a)
-        if a[0] == b[0]:
-            return self._calculate_distance(a[1:], b[1:])
-        l1 = self._calculate_distance(a, b[1:])
-        l2 = self._calculate_distance(a[1:], b)
-        l3 = self._calculate_distance(a[1:], b[1:])
-        return min(l1, l2, l3) + 1
+        if max_distance is not None:
+            max_distance = int(max_distance)
+        return levenshtein(a, b, max_distance, bit_parallel)
 
     def reverse(self) -> WeakStr:
         """
@@ -148,24 +219,30 @@ class WeakStr(str):
         """
         Возвращает самую длинную общую подстроку.
 
+        Использует суффиксный автомат, время и память линейны.
+
         Args:
             s2 (str): вторая строка.
 
         Returns:
             WeakStr: самая длинная общая подстрока.
         """
-        m = [[0] * (1 + len(s2)) for _ in range(1 + len(self))]
-        longest, x_longest = 0, 0
-        for x in range(1, 1 + len(self)):
-            for y in range(1, 1 + len(s2)):
-                if self[x - 1] == s2[y - 1]:
-                    m[x][y] = m[x - 1][y - 1] + 1
-                    if m[x][y] > longest:
-                        longest = m[x][y]
-                        x_longest = x
-                else:
-                    m[x][y] = 0
-        return self._create_class(self[x_longest - longest: x_longest])
+        return self._create_class(longest_common_substring(self, s2))
+
+    def longest_common_substring_many(self, *strings: str) -> WeakStr:
+        """
+        Возвращает самую длинную подстроку, общую для текущей строки
+        и всех переданных строк.
+
+        Args:
+            strings (str): остальные строки.
+
+        Returns:
+            WeakStr: самая длинная общая подстрока.
+        """
+        return self._create_class(
+            longest_common_substring_many((str(self),) + strings)
+        )
 
     def remove_repeated_chars(self,
                               exclude:
@@ -180,12 +257,9 @@ class WeakStr(str):
         Returns:
             WeakStr: строка состоящая из неповторяющихся символов.
         """
-        exclude = exclude if exclude is not None else []
-        result_str = []
-        for i in self:
-            if i not in result_str or i in exclude:
-                result_str.append(i)
-        return self._create_class(''.join(result_str))
+        return self._create_class(
+            ''.join(self.remove_repeated_chars_stream((self,), exclude))
+        )
 
     def remove_duplicate_words(self,
                                exclude:
@@ -200,12 +274,79 @@ class WeakStr(str):
         Returns:
             WeakStr: строка состоящая из неповторяющихся слов.
         """
-        exclude = exclude if exclude is not None else []
-        result_str = []
-        for i in self.split(' '):
-            if i not in result_str or i in exclude:
-                result_str.append(i)
-        return self._create_class(' '.join(result_str))
+        return self._create_class(
+            ''.join(self.remove_duplicate_words_stream((self,), exclude))
+        )
+
+    @staticmethod
+    def remove_repeated_chars_stream(chunks: Iterable[str],
+                                     exclude:
+                                     Optional[list, tuple, set] = None
+                                     ) -> Iterator[str]:
+        """
+        Потоковый вариант remove_repeated_chars.
+
+        Принимает фрагменты текста и для каждого возвращает его часть
+        без уже встречавшихся символов. Весь текст в памяти не хранится,
+        только множество встреченных символов.
+
+        Args:
+            chunks (Iterable[str]): фрагменты текста.
+            exclude (list): список символов, которые не должны удаляться.
+
+        Returns:
+            Iterator[str]: обработанные фрагменты.
+        """
+        exclude = _to_lookup(exclude)
+        seen = set()
+        for chunk in chunks:
+            result_str = []
+            for i in chunk:
+                if i not in seen:
+                    seen.add(i)
+                    result_str.append(i)
+                elif i in exclude:
+                    result_str.append(i)
+            yield ''.join(result_str)
+
+    @staticmethod
+    def remove_duplicate_words_stream(chunks: Iterable[str],
+                                      exclude:
+                                      Optional[list, tuple, set] = None
+                                      ) -> Iterator[str]:
+        """
+        Потоковый вариант remove_duplicate_words.
+
+        Слово, разрезанное границей фрагментов, дожидается следующего
+        фрагмента. Склеенный результат совпадает с результатом
+        remove_duplicate_words для всего текста.
+
+        Args:
+            chunks (Iterable[str]): фрагменты текста.
+            exclude (list): список слов, которые не должны удаляться.
+
+        Returns:
+            Iterator[str]: обработанные фрагменты.
+        """
+        exclude = _to_lookup(exclude)
+        seen = set()
+        separator = ''
+        tail = ''
+        for chunk in chunks:
+            words = (tail + chunk).split(' ')
+            tail = words.pop()
+            result_str = []
+            for i in words:
+                if i not in seen:
+                    seen.add(i)
+                    result_str.append(i)
+                elif i in exclude:
+                    result_str.append(i)
+            if result_str:
+                yield separator + ' '.join(result_str)
+                separator = ' '
+        if tail not in seen or tail in exclude:
+            yield separator + tail
 
     def extract_numbers(self) -> List[int]:
         """
@@ -214,7 +355,7 @@ class WeakStr(str):
         Returns:
             List[int]: список с полученными числами.
         """
-        return [int(x) for x in re.findall(r'\d+', self)]
+        return [int(x) for x in NUMBER_PATTERN.findall(self)]
 
     def is_valid_email(self) -> bool:
         """
@@ -224,7 +365,7 @@ class WeakStr(str):
         Returns:
             bool: True, если строка является корректным email, иначе False.
          """
-        return re.match(r'^[\w.-]+@[\w.-]+\.[a-z]{2,6}$', self) is not None
+        return EMAIL_PATTERN.match(self) is not None
 
     def mask_credit_card(self) -> WeakStr:
         """
@@ -234,28 +375,34 @@ class WeakStr(str):
         Returns:
             WeakStr: строка с заменёнными символами.
          """
-        result_string = re.sub(r'(\d{4})\d+(\d{4})', r'\1XXXXXXXXX\2', self)
+        result_string = CREDIT_CARD_PATTERN.sub(r'\1XXXXXXXXX\2', self)
         return self._create_class(result_string)
 
     def hash_string(self, algorithm: str = 'sha256') -> WeakStr:
         """
         Возвращает хеш-сумму строки 's' по указанному алгоритму 'algorithm'.
 
+        Длинные строки кодируются и хешируются блоками, без полной
+        копии в байтах.
+
         Returns:
             WeakStr: зашифрованная строка.
         """
-        h = hashlib.new(algorithm)
-        h.update(self.encode())
-        return self._create_class(h.hexdigest())
+        if len(self) <= DEFAULT_BLOCK_SIZE:
+            return self._create_class(
+                hashlib.new(algorithm, self.encode()).hexdigest())
+        chunks = (self[i:i + DEFAULT_BLOCK_SIZE].encode()
+                  for i in range(0, len(self), DEFAULT_BLOCK_SIZE))
+        return self._create_class(hash_stream(chunks, algorithm))
 
     def compare_hashes(self, hash2: str) -> bool:
         """
-        Сравнивает две хеш-суммы.
+        Сравнивает две хеш-суммы за постоянное время.
 
         Returns:
             bool: True, если они равны, иначе False.
         """
-        return self == hash2
+        return compare_hashes(self, hash2)
 
     def replace_first_occurrence(self,
                                  old_substr: str,
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from typing import Iterable, List
+
+
+class SuffixAutomaton:
+    """
+    Суффиксный автомат строки.
+
+    Распознаёт все подстроки строки и строится за линейное время.
+    Содержит не более 2 * len(string) состояний, которые хранятся
+    в параллельных списках:
+        length - длина самой длинной строки состояния;
+        link - суффиксная ссылка;
+        transitions - переходы по символам;
+        first_end - позиция конца первого вхождения строк состояния.
+    """
+
+    def __init__(self, string: str):
+        self.string = string
+        self.length = [0]
+        self.link = [-1]
+        self.transitions = [{}]
+        self.first_end = [-1]
+        last = 0
+        for position, char in enumerate(string):
+            last = self._extend(last, char, position)
+
+    def __len__(self) -> int:
+        return len(self.length)
+
+    def _extend(self, last: int, char: str, position: int) -> int:
+        length, link = self.length, self.link
+        transitions, first_end = self.transitions, self.first_end
+
+        current = len(length)
+        length.append(length[last] + 1)
+        link.append(0)
+        transitions.append({})
+        first_end.append(position)
+
+        state = last
+        while state != -1 and char not in transitions[state]:
+            transitions[state][char] = current
+            state = link[state]
+        if state == -1:
+            return current
+
+        target = transitions[state][char]
+        if length[state] + 1 == length[target]:
+            link[current] = target
+            return current
+
+        clone = len(length)
+        length.append(length[state] + 1)
+        link.append(link[target])
+        transitions.append(transitions[target].copy())
+        first_end.append(first_end[target])
+        while state != -1 and transitions[state].get(char) == target:
+            transitions[state][char] = clone
+            state = link[state]
+        link[target] = link[current] = clone
+        return current
+
+    def match_lengths(self, text: str) -> Iterable[tuple]:
+        """
+        Для каждой позиции text возвращает пару (состояние, длина)
+        самого длинного суффикса text[:i + 1], который является
+        подстрокой строки автомата.
+        """
+        length, link, transitions = self.length, self.link, self.transitions
+        state = matched = 0
+        for char in text:
+            while state and char not in transitions[state]:
+                state = link[state]
+                matched = length[state]
+            state = transitions[state].get(char, 0)
+            matched = matched + 1 if state else 0
+            yield state, matched
+
+    def states_by_length(self) -> List[int]:
+        """
+        Возвращает состояния в порядке убывания длины (сортировка
+        подсчётом), чтобы суффиксные ссылки обходились после потомков.
+        """
+        buckets = [0] * (len(self.string) + 2)
+        for value in self.length:
+            buckets[value] += 1
+        for i in range(len(buckets) - 2, -1, -1):
+            buckets[i] += buckets[i + 1]
+        order = [0] * len(self.length)
+        for state, value in enumerate(self.length):
+            buckets[value] -= 1
+            order[buckets[value]] = state
+        return order
+
+
+def longest_common_substring(a: str, b: str) -> str:
+    """
+    Возвращает самую длинную общую подстроку a и b.
+
+    Строит суффиксный автомат по b и один раз проходит по a,
+    поэтому время и память линейны. При равной длине возвращается
+    подстрока, которая раньше всех заканчивается в a.
+
+    Args:
+        a (str): первая строка.
+        b (str): вторая строка.
+
+    Returns:
+        str: самая длинная общая подстрока.
+    """
+    if not a or not b:
+        return a[:0]
+    longest = end = 0
+    for position, (_, matched) in enumerate(
+            SuffixAutomaton(b).match_lengths(a)):
+        if matched > longest:
+            longest, end = matched, position + 1
+    return a[end - longest:end]
+
+
+def longest_common_substring_many(strings: Iterable[str]) -> str:
+    """
+    Возвращает самую длинную подстроку, общую для всех строк.
+
+    Автомат строится по самой короткой строке. Для каждой из
+    остальных строк вычисляется длина совпадения в каждом состоянии,
+    и в состоянии сохраняется минимум по всем строкам.
+
+    Args:
+        strings (Iterable[str]): строки для поиска.
+
+    Returns:
+        str: самая длинная общая подстрока.
+    """
+    strings = list(strings)
+    if not strings:
+        return ''
+    base = min(strings, key=len)
+    if not base:
+        return base
+
+    automaton = SuffixAutomaton(base)
+    length, link = automaton.length, automaton.link
+    order = automaton.states_by_length()
+    common = length[:]
+    for other in strings:
+        if other is base:
+            continue
+        matched = [0] * len(automaton)
+        for state, value in automaton.match_lengths(other):
+            if value > matched[state]:
+                matched[state] = value
+        for state in order:
+            parent = link[state]
+            if parent > 0 and matched[state]:
+                matched[parent] = length[parent]
+        for state, value in enumerate(matched):
+            if value < common[state]:
+                common[state] = value
+
+    best = 0
+    for state in range(1, len(automaton)):
+        if common[state] > common[best] or (
+                common[state] == common[best]
+                and automaton.first_end[state] < automaton.first_end[best]):
+            best = state
+    end = automaton.first_end[best] + 1
+    return base[end - common[best]:end]
@@ -1,24 +1,34 @@
 from typing import Union, Iterable, Callable, Any
+from weakref import WeakSet
 
+from data_types.cycle import CycleIterator
+from data_types.lazy import LazyPipeline
+from data_types.persistent import PersistentVector
 from errors.error import MaxSizeException
 
 
 class ModifiableTuple(tuple):
     __max_size = None
-
-    def cycle(self):
-        number_iter = 0
-        self.__run = True
-        while True:
-            if not self.__run:
-                break
-            yield self[number_iter]
-            number_iter += 1
-            if number_iter >= len(self):
-                number_iter = 0
+    __cycles = None
+
+    def cycle(self, *others: Iterable) -> CycleIterator:
+        """
+        Возвращает бесконечный итератор по элементам по кругу.
+
+        Если переданы другие коллекции, элементы берутся из всех
+        по очереди. У каждого итератора своя остановка (stop()),
+        stop_cycle() останавливает все итераторы этого объекта.
+        Подробнее см. data_types.cycle.CycleIterator.
+        """
+        iterator = CycleIterator(self, *others)
+        if self.__cycles is None:
+            self.__cycles = WeakSet()
+        self.__cycles.add(iterator)
+        return iterator
 
     def stop_cycle(self):
-        self.__run = False
+        for iterator in list(self.__cycles or ()):
+            iterator.stop()
 
     def get_by_type(self, type_: Union[Callable, Iterable]):
         type_ = self._get_tuple_type(type_)
@@ -71,6 +81,23 @@ class ModifiableTuple(tuple):
     def len(self):
         return len(self)
 
+    def lazy(self) -> LazyPipeline:
+        """
+        Возвращает ленивый конвейер над элементами: filter, map,
+        select_type, limit и chunk выполняются за один проход без
+        промежуточных коллекций. Подробнее см.
+        data_types.lazy.LazyPipeline.
+        """
+        return LazyPipeline(self)
+
+    def persistent(self) -> PersistentVector:
+        """
+        Возвращает копию кортежа в виде постоянного вектора: append,
+        set и pop у него стоят O(log32 n), а версии разделяют общие
+        узлы. Подробнее см. data_types.persistent.PersistentVector.
+        """
+        return PersistentVector(self)
+
     def filter(self, filter_func: Callable):
         new_data = []
         for i in range(len(self)):
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import math
+from typing import Iterable, Union
+
+from data_types.compact import CompactList
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEGREES = math.pi / 180
+
+Numbers = Iterable[Union[int, float]]
+
+
+def sin_many(values: Numbers) -> CompactList:
+    """
+    Возвращает синусы углов, заданных в градусах, как
+    _FunctionalNumbers.sin для каждого значения.
+
+    Все функции модуля принимают SuperiorList, ModifiableTuple,
+    CompactList, список или массив NumPy. С NumPy перевод в радианы
+    и функция считаются одним векторным проходом, без NumPy - одним
+    циклом по math. Результат - CompactList без отдельного объекта
+    WeakInt или CorrectFloat на каждое значение.
+    """
+    if np is not None:
+        return CompactList(np.sin(_float_array(values) * DEGREES))
+    sin = math.sin
+    return CompactList([sin(value * DEGREES) for value in values])
+
+
+def cos_many(values: Numbers) -> CompactList:
+    """
+    Возвращает косинусы углов, заданных в градусах.
+    """
+    if np is not None:
+        return CompactList(np.cos(_float_array(values) * DEGREES))
+    cos = math.cos
+    return CompactList([cos(value * DEGREES) for value in values])
+
+
+def tan_many(values: Numbers) -> CompactList:
+    """
+    Возвращает тангенсы углов, заданных в градусах.
+    """
+    if np is not None:
+        return CompactList(np.tan(_float_array(values) * DEGREES))
+    tan = math.tan
+    return CompactList([tan(value * DEGREES) for value in values])
+
+
+def log_many(values: Numbers, base: float = 2) -> CompactList:
+    """
+    Возвращает логарифмы значений по основанию base.
+
+    Raises:
+        ValueError: если base или одно из значений неположительно
+         (как math.log).
+        ZeroDivisionError: если base == 1 (как math.log).
+    """
+    # Основание проверяется до выбора пути, чтобы NumPy не вернул
+    # inf или nan там, где math.log бросает исключение.
+    divisor = math.log(base)
+    if not divisor:
+        raise ZeroDivisionError("float division by zero")
+    if np is not None:
+        array = _float_array(values)
+        if (array <= 0).any():
+            raise ValueError("math domain error")
+        return CompactList(np.log(array) / divisor)
+    log = math.log
+    return CompactList([log(value) / divisor for value in values])
+
+
+def sqrt_many(values: Numbers, n: int = 2) -> CompactList:
+    """
+    Возвращает корни степени n из значений.
+
+    В отличие от WeakInt.sqrt, результат не усекается до целого.
+
+    Raises:
+        ValueError: если среди значений есть отрицательные
+         (как math.sqrt).
+    """
+    if np is not None:
+        array = _float_array(values)
+        if (array < 0).any():
+            raise ValueError("math domain error")
+        if n == 2:
+            return CompactList(np.sqrt(array))
+        return CompactList(np.power(array, 1 / n))
+    if n == 2:
+        sqrt = math.sqrt
+        return CompactList([sqrt(value) for value in values])
+    exponent = 1 / n
+    result = []
+    for value in values:
+        if value < 0:
+            raise ValueError("math domain error")
+        result.append(value ** exponent)
+    return CompactList(result)
+
+
+def pow_many(values: Numbers, n: Union[int, float] = 2) -> CompactList:
+    """
+    Возвращает значения в степени n.
+
+    Целые значения в целой неотрицательной степени остаются целыми
+    и точными. NumPy считает их в int64, только если
+    n * log2(max |x|) < 62, то есть результат заведомо помещается
+    в int64, иначе - циклом Python по целым Python.
+    """
+    if np is not None:
+        array = _array(values)
+        if array.dtype.kind in 'iu' and isinstance(n, int) and n >= 0:
+            largest = max(abs(int(array.min())), abs(int(array.max()))) \
+                if array.size else 0
+            if largest < 2 or n * math.log2(largest) < 62:
+                return CompactList(np.power(array.astype(np.int64), n))
+        elif array.dtype.kind in 'iuf':
+            return CompactList(np.power(array.astype(float), n))
+        # tolist() отдаёт int Python, которые не переполняются.
+        values = array.tolist()
+    return CompactList([value ** n for value in values])
+
+
+def _array(values: Numbers):
+    """
+    Возвращает значения массивом NumPy, по возможности без копии.
+    """
+    if isinstance(values, np.ndarray):
+        return values
+    if isinstance(values, CompactList):
+        return values.to_numpy(copy=False)
+    # list() идёт через __iter__, поэтому кольцевой SuperiorList
+    # отдаёт элементы в логическом порядке.
+    return np.asarray(list(values))
+
+
+def _float_array(values: Numbers):
+    if isinstance(values, (list, tuple)):
+        return np.fromiter(values, dtype=float, count=len(values))
+    return _array(values).astype(float, copy=False)
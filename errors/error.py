@@ -12,3 +12,15 @@ class MaxSizeException(ValueError):
 
 class IntervalError(ValueError):
     pass
+
+
+class CycleError(ValueError):
+    pass
+
+
+class RuleApplicationError(RuntimeError):
+    def __init__(self, errors: list):
+        self.errors = errors
+        super().__init__(
+            f'Правило завершилось ошибкой для {len(errors)} элементов'
+        )